@@ -1,29 +1,34 @@
-from clypi import parsers
-from clypi._cli.arg_config import Positional, arg
-from clypi._cli.distance import closest, distance
-from clypi._cli.formatter import ClypiFormatter, Formatter
-from clypi._cli.main import Command
-from clypi._colors import ALL_COLORS, ColorType, Styler, cprint, style
-from clypi._components.align import AlignType, align
-from clypi._components.boxed import Boxes, boxed
-from clypi._components.indented import indented
-from clypi._components.separator import separator
-from clypi._components.spinners import Spin, Spinner, spinner
-from clypi._components.stack import stack
-from clypi._components.wraps import OverflowStyle, wrap
-from clypi._configuration import ClypiConfig, Theme, configure, get_config
-from clypi._exceptions import (
-    AbortException,
-    ClypiException,
-    MaxAttemptsException,
-    format_traceback,
-    print_traceback,
-)
-from clypi._prompts import (
-    confirm,
-    prompt,
-)
-from clypi.parsers import Parser
+import sys
+import typing as t
+from importlib import import_module
+
+if t.TYPE_CHECKING:
+    from clypi import parsers
+    from clypi._cli.arg_config import Positional, arg
+    from clypi._cli.distance import closest, distance
+    from clypi._cli.formatter import ClypiFormatter, Formatter
+    from clypi._cli.main import Command
+    from clypi._colors import ALL_COLORS, ColorType, Styler, cprint, style
+    from clypi._components.align import AlignType, align
+    from clypi._components.boxed import Boxes, boxed
+    from clypi._components.indented import indented
+    from clypi._components.separator import separator
+    from clypi._components.spinners import Spin, Spinner, spinner
+    from clypi._components.stack import stack
+    from clypi._components.wraps import OverflowStyle, wrap
+    from clypi._configuration import ClypiConfig, Theme, configure, get_config
+    from clypi._exceptions import (
+        AbortException,
+        ClypiException,
+        MaxAttemptsException,
+        format_traceback,
+        print_traceback,
+    )
+    from clypi._prompts import (
+        confirm,
+        prompt,
+    )
+    from clypi.parsers import Parser
 
 __all__ = (
     "ALL_COLORS",
@@ -64,3 +69,69 @@ __all__ = (
     "style",
     "wrap",
 )
+
+# Public names are only imported the first time they're accessed so that
+# `import clypi` stays cheap. Maps each attribute to its module, where an
+# attribute mapping to a module of its own name is a submodule itself
+_PACKAGE = __spec__.parent
+_dynamic_imports: dict[str, str] = {
+    "parsers": ".parsers",
+    "Positional": "._cli.arg_config",
+    "arg": "._cli.arg_config",
+    "closest": "._cli.distance",
+    "distance": "._cli.distance",
+    "ClypiFormatter": "._cli.formatter",
+    "Formatter": "._cli.formatter",
+    "Command": "._cli.main",
+    "ALL_COLORS": "._colors",
+    "ColorType": "._colors",
+    "Styler": "._colors",
+    "cprint": "._colors",
+    "style": "._colors",
+    "AlignType": "._components.align",
+    "align": "._components.align",
+    "Boxes": "._components.boxed",
+    "boxed": "._components.boxed",
+    "indented": "._components.indented",
+    "separator": "._components.separator",
+    "Spin": "._components.spinners",
+    "Spinner": "._components.spinners",
+    "spinner": "._components.spinners",
+    "stack": "._components.stack",
+    "OverflowStyle": "._components.wraps",
+    "wrap": "._components.wraps",
+    "ClypiConfig": "._configuration",
+    "Theme": "._configuration",
+    "configure": "._configuration",
+    "get_config": "._configuration",
+    "AbortException": "._exceptions",
+    "ClypiException": "._exceptions",
+    "MaxAttemptsException": "._exceptions",
+    "format_traceback": "._exceptions",
+    "print_traceback": "._exceptions",
+    "confirm": "._prompts",
+    "prompt": "._prompts",
+    "Parser": ".parsers",
+}
+
+
+def __getattr__(attr_name: str) -> t.Any:
+    module_name = _dynamic_imports.get(attr_name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {attr_name!r}")
+
+    is_submodule = module_name == f".{attr_name}"
+
+    # Avoid going through the import machinery if it's already been imported
+    module = sys.modules.get(_PACKAGE + module_name) or import_module(
+        module_name, package=_PACKAGE
+    )
+    result = module if is_submodule else module.__dict__[attr_name]
+
+    # Cache it in the module so that `__getattr__` is not called again
+    globals()[attr_name] = result
+    return result
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
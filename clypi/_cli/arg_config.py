@@ -1,27 +1,29 @@
 import typing as t
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, field, fields
 
-from clypi import _type_util
-from clypi._cli import arg_parser
+from clypi._cli.arg_parser import snake_to_dash
+from clypi._constants import MAX_ATTEMPTS
 from clypi._exceptions import ClypiException
-from clypi._prompts import MAX_ATTEMPTS
+from clypi._type_util import cache_by_type, is_union, union_inner
+from clypi._type_util import is_list as _is_list_type
 from clypi._util import UNSET, Unset
 from clypi.parsers import Parser
 
 T = t.TypeVar("T")
 
-Nargs: t.TypeAlias = t.Literal["*"] | float
+Nargs: t.TypeAlias = t.Literal["*", "+"] | int
 
 
+@cache_by_type
 def _get_nargs(_type: t.Any) -> Nargs:
     if _type is bool:
         return 0
 
-    if _type_util.is_list(_type):
+    if _is_list_type(_type):
         return "*"
 
-    if _type_util.is_union(_type):
-        nargs = [_get_nargs(t) for t in _type_util.union_inner(_type)]
+    if is_union(_type):
+        nargs = [_get_nargs(t) for t in union_inner(_type)]
         if "*" in nargs:
             return "*"
         return max(t.cast(list[int], nargs))
@@ -29,7 +31,20 @@ def _get_nargs(_type: t.Any) -> Nargs:
     return 1
 
 
-@dataclass
+def _get_modifier(nargs: Nargs) -> str:
+    if nargs == "+" or nargs == "*" or nargs > 1:
+        return "…"
+    return ""
+
+
+@cache_by_type
+def _is_positional_type(_type: t.Any) -> bool:
+    # Only `t.Annotated` types have metadata
+    metadata = getattr(_type, "__metadata__", None)
+    return metadata is not None and any(m is _POSITIONAL for m in metadata)
+
+
+@dataclass(slots=True)
 class PartialConfig(t.Generic[T]):
     parser: Parser[T] | None = None
     default: T | Unset = UNSET
@@ -47,7 +62,12 @@ class PartialConfig(t.Generic[T]):
     env: str | None = None
 
 
-@dataclass
+# All fields in PartialConfig except the parser. They are declared in the same
+# order in Config (right after `arg_type`) so they can be passed positionally
+_SHARED_FIELDS = tuple(f.name for f in fields(PartialConfig) if f.name != "parser")
+
+
+@dataclass(slots=True)
 class Config(t.Generic[T]):
     name: str
     parser: Parser[T]
@@ -66,27 +86,51 @@ class Config(t.Generic[T]):
     defer: bool = False
     env: str | None = None
 
+    # Derived from the type hints once so that the parser and formatter can
+    # read them without redoing any typing introspection
+    _is_positional: bool = field(init=False, repr=False, compare=False)
+    _nargs: Nargs = field(init=False, repr=False, compare=False)
+    _is_list: bool = field(init=False, repr=False, compare=False)
+    _modifier: str = field(init=False, repr=False, compare=False)
+    _display_name: str = field(init=False, repr=False, compare=False)
+    _short_display_name: str | None = field(init=False, repr=False, compare=False)
+
+    # Only needed to render help pages so they're computed the first time they're used
+    _type_display: str | None = field(
+        init=False, default=None, repr=False, compare=False
+    )
+    _upper_name: str | None = field(init=False, default=None, repr=False, compare=False)
+
     def __post_init__(self):
+        self._is_positional = _is_positional_type(self.arg_type)
+        self._nargs = _get_nargs(self.arg_type)
+        self._is_list = _is_list_type(self.arg_type)
+        self._modifier = _get_modifier(self._nargs)
+
+        name = snake_to_dash(self.name)
+        self._display_name = name if self._is_positional else "--" + name
+        self._short_display_name = (
+            "-" + snake_to_dash(self.short) if self.short else None
+        )
+
         if self.is_positional and self.short:
             raise ClypiException("Positional arguments cannot have short names")
         if self.is_positional and self.group:
             raise ClypiException("Positional arguments cannot belong to groups")
 
     def has_default(self) -> bool:
-        return not isinstance(self.default, Unset) or not isinstance(
-            self.default_factory, Unset
-        )
+        return self.default is not UNSET or self.default_factory is not UNSET
 
     def get_default(self) -> T:
         val = self.get_default_or_missing()
-        if isinstance(val, Unset):
+        if val is UNSET:
             raise ValueError(f"Field {self} has no default value!")
         return val
 
     def get_default_or_missing(self) -> T | Unset:
-        if not isinstance(self.default, Unset):
+        if self.default is not UNSET:
             return self.default
-        if not isinstance(self.default_factory, Unset):
+        if self.default_factory is not UNSET:
             return self.default_factory()
         return UNSET
 
@@ -98,58 +142,61 @@ class Config(t.Generic[T]):
         parser: Parser[T] | None,
         arg_type: t.Any,
     ):
-        kwargs = asdict(partial)
-        kwargs.update(name=name, parser=parser, arg_type=arg_type)
-        return cls(**kwargs)
+        # Shallow copy on purpose: `asdict` would deepcopy defaults and
+        # recursively turn dataclass values (e.g.: parsers) into dicts
+        shared = [getattr(partial, f) for f in _SHARED_FIELDS]
+
+        # Inherited fields get their parser from the parent command once
+        # `Command.inherit` runs, so it's only None until then
+        return cls(name, t.cast(Parser[T], parser), arg_type, *shared)
 
     @property
-    def display_name(self):
-        name = arg_parser.snake_to_dash(self.name)
-        if self.is_opt:
-            return f"--{name}"
-        return name
+    def display_name(self) -> str:
+        return self._display_name
 
     @property
     def negative_name(self):
         assert self.is_opt, "negative_name can only be used for options"
         assert self.negative, "negative is not set"
-        negative_name = arg_parser.snake_to_dash(self.negative)
+        negative_name = snake_to_dash(self.negative)
         return f"--{negative_name}"
 
     @property
-    def short_display_name(self):
-        assert self.short, f"Expected short to be set in {self}"
-        name = arg_parser.snake_to_dash(self.short)
-        return f"-{name}"
+    def short_display_name(self) -> str:
+        assert self._short_display_name, f"Expected short to be set in {self}"
+        return self._short_display_name
 
     @property
-    def is_positional(self) -> bool:
-        if t.get_origin(self.arg_type) != t.Annotated:
-            return False
+    def type_display(self) -> str:
+        if self._type_display is None:
+            self._type_display = str(self.parser).upper()
+        return self._type_display
 
-        metadata = self.arg_type.__metadata__
-        for m in metadata:
-            if isinstance(m, _Positional):
-                return True
+    @property
+    def upper_name(self) -> str:
+        if self._upper_name is None:
+            self._upper_name = self.name.upper()
+        return self._upper_name
 
-        return False
+    @property
+    def is_positional(self) -> bool:
+        return self._is_positional
 
     @property
     def is_opt(self) -> bool:
-        return not self.is_positional
+        return not self._is_positional
 
     @property
     def nargs(self) -> Nargs:
-        return _get_nargs(self.arg_type)
+        return self._nargs
+
+    @property
+    def is_list(self) -> bool:
+        return self._is_list
 
     @property
     def modifier(self) -> str:
-        nargs = self.nargs
-        if nargs in ("+", "*"):
-            return "…"
-        elif isinstance(nargs, int) and nargs > 1:
-            return "…"
-        return ""
+        return self._modifier
 
 
 def arg(
@@ -186,10 +233,13 @@ def arg(
     )  # type: ignore
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class _Positional:
     pass
 
 
+# Single instance shared by all annotations so it can be checked by identity
+_POSITIONAL = _Positional()
+
 P = t.TypeVar("P")
-Positional: t.TypeAlias = t.Annotated[P, _Positional()]
+Positional: t.TypeAlias = t.Annotated[P, _POSITIONAL]
@@ -1,14 +1,34 @@
-import re
+import string
 import typing as t
 from dataclasses import dataclass
 
-_COMPRESSED_ARG = re.compile(r"^-[a-zA-Z]{2,}$")
-_SHORT_ARG = re.compile(r"^-[a-zA-Z]$")
-_LONG_ARG = re.compile(r"^--[a-zA-Z][a-zA-Z0-9\-\_]+$")
+_LETTERS = frozenset(string.ascii_letters)
+_LONG_ARG_CHARS = _LETTERS | frozenset(string.digits) | {"-", "_"}
+
+
+# Hand-rolled equivalents of the regexes below since they run for every arg:
+# - Compressed: ^-[a-zA-Z]{2,}$
+# - Short: ^-[a-zA-Z]$
+# - Long: ^--[a-zA-Z][a-zA-Z0-9\-\_]+$
+def _is_compressed_arg(s: str) -> bool:
+    return len(s) > 2 and s[0] == "-" and _LETTERS.issuperset(s[1:])
+
+
+def _is_short_arg(s: str) -> bool:
+    return len(s) == 2 and s[0] == "-" and s[1] in _LETTERS
+
+
+def _is_long_arg(s: str) -> bool:
+    return (
+        len(s) > 3
+        and s[:2] == "--"
+        and s[2] in _LETTERS
+        and _LONG_ARG_CHARS.issuperset(s[3:])
+    )
 
 
 def dash_to_snake(s: str) -> str:
-    return re.sub(r"^-+", "", s).replace("-", "_")
+    return s.lstrip("-").replace("-", "_")
 
 
 def snake_to_dash(s: str) -> str:
@@ -17,22 +37,29 @@ def snake_to_dash(s: str) -> str:
 
 def normalize_args(args: t.Sequence[str]) -> list[str]:
     new_args: list[str] = []
+    append, extend = new_args.append, new_args.extend
     for a in args:
+        # Anything that isn't an option is left as is
+        if a[:1] != "-":
+            append(a)
+
         # Expand -a=1 or --a=1 into --a 1
-        if a.startswith("-") and "=" in a:
-            new_args.extend(a.split("=", 1))
+        elif "=" in a:
+            key, _, value = a.partition("=")
+            append(key)
+            append(value)
 
         # Expand -abc into -a -b -c
-        elif _COMPRESSED_ARG.match(a):
-            new_args.extend(f"-{arg}" for arg in a[1:])
+        elif _is_compressed_arg(a):
+            extend("-" + arg for arg in a[1:])
 
         # Leave as is
         else:
-            new_args.append(a)
+            append(a)
     return new_args
 
 
-@dataclass
+@dataclass(slots=True)
 class Arg:
     value: str
     orig: str
@@ -48,14 +75,17 @@ class Arg:
         return self.arg_type == "short-opt"
 
     def is_opt(self):
-        return self.is_long_opt() or self.is_short_opt()
+        return self.arg_type != "pos"
 
 
 def parse_as_attr(arg: str) -> Arg:
-    if _LONG_ARG.match(arg):
-        return Arg(value=dash_to_snake(arg), orig=arg, arg_type="long-opt")
-
-    if _SHORT_ARG.match(arg):
-        return Arg(value=dash_to_snake(arg), orig=arg, arg_type="short-opt")
-
-    return Arg(value=arg, orig=arg, arg_type="pos")
+    # Only args starting with dashes can be options, so look at the prefix
+    # once to know which check (if any) applies
+    if arg[:1] == "-":
+        if arg[1:2] == "-":
+            if _is_long_arg(arg):
+                return Arg(dash_to_snake(arg), arg, "long-opt")
+        elif _is_short_arg(arg):
+            return Arg(arg[1:], arg, "short-opt")
+
+    return Arg(arg, arg, "pos")
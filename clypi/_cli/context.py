@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from clypi._cli.arg_config import Nargs
 
 
-@dataclass
+@dataclass(slots=True)
 class CurrentCtx:
     name: str = ""
     nargs: Nargs = 0
@@ -11,19 +11,22 @@ class CurrentCtx:
 
     _collected: list[str] = field(init=False, default_factory=list)
 
+    # How many more items can be collected, where -1 means there's no limit
+    _remaining: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        # Non-numeric nargs (e.g.: "*") can collect any amount of items
+        self._remaining = self.nargs if isinstance(self.nargs, int) else -1
+
     def has_more(self) -> bool:
-        if isinstance(self.nargs, float | int):
-            return self.nargs > 0
-        return True
+        return self._remaining != 0
 
     def needs_more(self) -> bool:
-        if isinstance(self.nargs, float | int):
-            return self.nargs > 0
-        return False
+        return self._remaining > 0
 
     def collect(self, item: str) -> None:
-        if isinstance(self.nargs, float | int):
-            self.nargs -= 1
+        if self._remaining > 0:
+            self._remaining -= 1
 
         self._collected.append(item)
 
@@ -1,8 +1,9 @@
 import typing as t
 from dataclasses import dataclass, field
 
+from clypi._constants import MAX_ATTEMPTS
 from clypi._data.dunders import ALL_DUNDERS
-from clypi._prompts import MAX_ATTEMPTS, prompt
+from clypi._prompts import prompt
 from clypi._util import UNSET, Unset
 from clypi.parsers import Parser
 
@@ -11,7 +12,11 @@ T = t.TypeVar("T")
 
 def gen_impl(__f: str) -> t.Callable[..., t.Any]:
     def _impl(self: "DeferredValue[t.Any]", *args: t.Any, **kwargs: t.Any) -> t.Any:
-        return getattr(self.__get__(None), __f)(*args, **kwargs)
+        # Skip going through `__get__` once the value has been prompted for
+        value = self._value  # pyright: ignore[reportPrivateUsage]
+        if value is UNSET:
+            value = self.__get__(None)
+        return getattr(value, __f)(*args, **kwargs)
 
     return _impl
 
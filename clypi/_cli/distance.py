@@ -1,49 +1,69 @@
 from typing import Iterable
 
 
-def distance(this: str, other: str) -> float:
+def _subst_dist(t: str, o: str) -> float:
+    if t == o:
+        return 0
+    elif t.lower() == o.lower():
+        return 0.5
+    return 1
+
+
+def _bounded_distance(this: str, other: str, max_dist: float) -> float:
     """
-    Modified version of the Levenshtein distance to consider the case
-    of the letters being compared so that dist(a, A) < dist(a, b)
+    Computes the distance between both words but stops as soon as it is known
+    to be over `max_dist`, in which case a lower bound of the distance is returned
     """
     if not this or not other:
         return max(len(this), len(other))
 
+    # The distance is at least the difference in length
     n, m = len(this), len(other)
-    dist: list[list[float]] = [[0 for _ in range(m + 1)] for _ in range(n + 1)]
-
-    # Prepopulate first X and Y axis
-    for t in range(0, n + 1):
-        dist[t][0] = t
-    for o in range(0, m + 1):
-        dist[0][o] = o
-
-    def _subst_dist(t: str, o: str) -> float:
-        if t == o:
-            return 0
-        elif t.lower() == o.lower():
-            return 0.5
-        return 1
-
-    # Compute actions
+    if abs(n - m) > max_dist:
+        return abs(n - m)
+
+    # Only the previous row of the matrix is needed to compute the next one
+    prev: list[float] = list(range(m + 1))
     for t in range(n):
+        curr: list[float] = [t + 1]
         for o in range(m):
-            insertion = dist[t][o + 1] + 1
-            deletion = dist[t + 1][o] + 1
-            substitution = dist[t][o] + _subst_dist(this[t], other[o])
-            dist[t + 1][o + 1] = min(insertion, deletion, substitution)
+            insertion = prev[o + 1] + 1
+            deletion = curr[o] + 1
+            substitution = prev[o] + _subst_dist(this[t], other[o])
+            curr.append(min(insertion, deletion, substitution))
+
+        # Every path goes through each row so the distance can only grow
+        row_min = min(curr)
+        if row_min > max_dist:
+            return row_min
+        prev = curr
 
     # Get bottom right of computed matrix
-    return dist[n][m]
+    return prev[m]
+
+
+def distance(this: str, other: str) -> float:
+    """
+    Modified version of the Levenshtein distance to consider the case
+    of the letters being compared so that dist(a, A) < dist(a, b)
+    """
+    return _bounded_distance(this, other, float("inf"))
 
 
-def closest(word: str, options: Iterable[str]) -> tuple[str, float]:
+def closest(
+    word: str,
+    options: Iterable[str],
+    max_dist: float = float("inf"),
+) -> tuple[str, float]:
     """
     Given a word and a list of options, it returns the closest
-    option to that word and it's distance
+    option to that word and it's distance. Options further away than
+    `max_dist` are never returned
     """
-    dists = [distance(word, o) for o in options]
-    if not dists:
-        return "", float("inf")
-    min_opt = min(zip(options, dists), key=lambda x: x[1])
-    return min_opt
+    best, best_dist = "", float("inf")
+    for option in options:
+        # No need to finish computing distances that can't beat the best one
+        dist = _bounded_distance(word, option, min(max_dist, best_dist))
+        if dist < best_dist and dist <= max_dist:
+            best, best_dist = option, dist
+    return best, best_dist
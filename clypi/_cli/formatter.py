@@ -6,7 +6,6 @@ from dataclasses import dataclass
 from functools import cached_property
 
 from clypi import _type_util
-from clypi._cli.arg_parser import dash_to_snake
 from clypi._colors import ColorType, style
 from clypi._components.boxed import boxed
 from clypi._components.indented import indented
@@ -62,7 +61,7 @@ class ClypiFormatter:
         first_col, *rest = columns
 
         # Filter out empty columns
-        rest = list(filter(any, rest))
+        rest = [col for col in rest if any(col)]
 
         if not self.boxed:
             section_title = self.theme.section_title(title)
@@ -78,31 +77,32 @@ class ClypiFormatter:
     def _format_option_value(self, option: Config[t.Any]):
         if option.nargs == 0:
             return ""
-        placeholder = dash_to_snake(option.name).upper()
+        placeholder = option.upper_name
         return self.theme.placeholder(f"<{placeholder}>")
 
     def _format_option(self, option: Config[t.Any]) -> tuple[str, ...]:
+        theme = self.theme
         help = self._maybe_norm_help(option.help or "")
 
         # E.g.: -r, --requirements <REQUIREMENTS>
-        usage = self.theme.long_option(option.display_name)
+        usage = theme.long_option(option.display_name)
         if short_usage := (
-            self.theme.short_option(option.short_display_name) if option.short else ""
+            theme.short_option(option.short_display_name) if option.short else ""
         ):
             usage = short_usage + ", " + usage
 
         # E.g.: --flag/--no-flag
         if option.negative:
-            usage += "/" + self.theme.long_option(option.negative_name)
+            usage += "/" + theme.long_option(option.negative_name)
 
         if not self.show_option_types:
             usage += " " + self._format_option_value(option)
 
         # E.g.: TEXT
         type_str = ""
-        type_upper = str(option.parser).upper()
+        type_upper = option.type_display
         if self.show_option_types:
-            type_str = self.theme.type_str(type_upper)
+            type_str = theme.type_str(type_upper)
         elif _type_util.has_metavar(option.arg_type):
             help = help + " " + type_upper if help else type_upper
 
@@ -111,23 +111,14 @@ class ClypiFormatter:
     def _format_option_group(
         self, title: str, options: list[Config[t.Any]]
     ) -> str | None:
-        usage: list[str] = []
-        type_str: list[str] = []
-        help: list[str] = []
-        for o in options:
-            # Hidden options do not get displayed for the user
-            if o.hidden:
-                continue
-
-            u, ts, hp = self._format_option(o)
-            usage.append(u)
-            type_str.append(ts)
-            help.append(hp)
-
-        if len(usage) == 0:
+        # Hidden options do not get displayed for the user
+        rows = [self._format_option(o) for o in options if not o.hidden]
+        if not rows:
             return None
 
-        return self._maybe_boxed(usage, type_str, help, title=title)
+        # Transpose the rows into the usage, type and help columns
+        columns = [list(col) for col in zip(*rows)]
+        return self._maybe_boxed(*columns, title=title)
 
     def _format_options(self, options: list[Config[t.Any]]) -> str | None:
         if not options:
@@ -144,52 +135,47 @@ class ClypiFormatter:
                 continue
             groups[o.group].append(o)
 
-        # Render all groups
-        rendered: list[str | None] = []
+        # Render all groups, skipping the ones with nothing to show
+        rendered: list[str] = []
         for group_name, options in groups.items():
             if not options:
                 continue
             name = f"{group_name or ''} Options".lstrip().capitalize()
-            rendered.append(self._format_option_group(name, options))
+            if group := self._format_option_group(name, options):
+                rendered.append(group)
 
-        return "\n\n".join(group for group in rendered if group)
+        return "\n\n".join(rendered)
 
     def _format_positional_with_mod(self, positional: Config[t.Any]) -> str:
         # E.g.: [FILES]...
-        pos_name = positional.name.upper()
+        pos_name = positional.upper_name
         name = f"[{pos_name}]{positional.modifier}"
         return name
 
     def _format_positional(self, positional: Config[t.Any]) -> tuple[str, ...]:
+        theme = self.theme
+
         # E.g.: [FILES]... or FILES
         name = (
-            self.theme.positional(self._format_positional_with_mod(positional))
+            theme.positional(self._format_positional_with_mod(positional))
             if not self.show_option_types
-            else self.theme.positional(positional.name.upper())
+            else theme.positional(positional.upper_name)
         )
 
         help = positional.help or ""
         type_str = (
-            self.theme.type_str(str(positional.parser).upper())
-            if self.show_option_types
-            else ""
+            theme.type_str(positional.type_display) if self.show_option_types else ""
         )
         return name, type_str, self._maybe_norm_help(help)
 
     def _format_positionals(self, positionals: list[Config[t.Any]]) -> str | None:
-        name: list[str] = []
-        type_str: list[str] = []
-        help: list[str] = []
-        for p in positionals:
-            n, ts, hp = self._format_positional(p)
-            name.append(n)
-            type_str.append(ts)
-            help.append(hp)
-
-        if len(name) == 0:
+        rows = [self._format_positional(p) for p in positionals]
+        if not rows:
             return None
 
-        return self._maybe_boxed(name, type_str, help, title="Arguments")
+        # Transpose the rows into the name, type and help columns
+        columns = [list(col) for col in zip(*rows)]
+        return self._maybe_boxed(*columns, title="Arguments")
 
     def _format_subcommand(self, subcmd: type[Command]) -> tuple[str, str]:
         name = self.theme.subcommand(subcmd.prog())
@@ -197,17 +183,13 @@ class ClypiFormatter:
         return name, self._maybe_norm_help(help)
 
     def _format_subcommands(self, subcommands: list[type[Command]]) -> str | None:
-        name: list[str] = []
-        help: list[str] = []
-        for p in subcommands:
-            n, hp = self._format_subcommand(p)
-            name.append(n)
-            help.append(hp)
-
-        if len(name) == 0:
+        rows = [self._format_subcommand(s) for s in subcommands]
+        if not rows:
             return None
 
-        return self._maybe_boxed(name, help, title="Subcommands")
+        # Transpose the rows into the name and help columns
+        columns = [list(col) for col in zip(*rows)]
+        return self._maybe_boxed(*columns, title="Subcommands")
 
     def _format_header(
         self,
@@ -216,17 +198,21 @@ class ClypiFormatter:
         positionals: list[Config[t.Any]],
         subcommands: list[type[Command]],
     ) -> str:
-        prefix = self.theme.usage("Usage:")
-        command_str = self.theme.usage_command(" ".join(full_command))
+        theme = self.theme
+        prefix = theme.usage("Usage:")
+        command_str = theme.usage_command(" ".join(full_command))
+
+        # E.g.: a command that takes no arguments at all
+        if not options and not positionals and not subcommands:
+            return f"{prefix} {command_str}"
 
-        positionals_str: list[str] = []
-        for pos in positionals:
-            name = self._format_positional_with_mod(pos)
-            positionals_str.append(self.theme.usage_args(name))
-        positional = " " + " ".join(positionals_str) if positionals else ""
+        positional = "".join(
+            " " + theme.usage_args(self._format_positional_with_mod(pos))
+            for pos in positionals
+        )
 
-        option = self.theme.usage_args(" [OPTIONS]") if options else ""
-        command = self.theme.usage_args(" COMMAND") if subcommands else ""
+        option = theme.usage_args(" [OPTIONS]") if options else ""
+        command = theme.usage_args(" COMMAND") if subcommands else ""
 
         return f"{prefix} {command_str}{positional}{option}{command}"
 
@@ -264,30 +250,14 @@ class ClypiFormatter:
         subcommands: list[type[Command]],
         exception: Exception | None,
     ) -> str:
-        lines: list[str | None] = []
-
-        # Description
-        lines.append(self._format_description(description))
-
-        # Header
-        lines.append(
-            self._format_header(full_command, options, positionals, subcommands)
+        # Each section is already a fully rendered string (or None if empty)
+        sections = (
+            self._format_description(description),
+            self._format_header(full_command, options, positionals, subcommands),
+            self._format_subcommands(subcommands),
+            self._format_positionals(positionals),
+            self._format_options(options),
+            self._format_epilog(epilog),
+            self._format_exception(exception),
         )
-
-        # Subcommands
-        lines.append(self._format_subcommands(subcommands))
-
-        # Positionals
-        lines.append(self._format_positionals(positionals))
-
-        # Options
-        lines.append(self._format_options(options))
-
-        # Epilog
-        lines.append(self._format_epilog(epilog))
-
-        # Exceptions
-        lines.append(self._format_exception(exception))
-
-        joined = "\n\n".join(line for line in lines if line)
-        return joined + "\n"
+        return "\n\n".join([section for section in sections if section]) + "\n"
@@ -1,11 +1,8 @@
 from __future__ import annotations
 
-import asyncio
-import dataclasses
+import copy
 import inspect
-import logging
 import os
-import re
 import sys
 import typing as t
 from types import NoneType
@@ -24,8 +21,6 @@ from clypi._exceptions import print_traceback
 from clypi._prompts import prompt
 from clypi._util import UNSET
 
-logger = logging.getLogger(__name__)
-
 __all__ = (
     "ClypiFormatter",
     "Command",
@@ -35,18 +30,52 @@ __all__ = (
 )
 
 
-HELP_ARGS: tuple[str, ...] = ("help", "-h", "--help")
+HELP_ARGS: frozenset[str] = frozenset(("help", "-h", "--help"))
+# Any arg that doesn't start with one of these can't be a help arg
+_HELP_ARGS_FIRST_CHARS: frozenset[str] = frozenset(("-", "h", "H"))
+
+# 2 is ~good for typos (e.g.: this -> that)
+MAX_TYPO_DISTANCE = 2
+
+
+def _parser_cache_key(_type: t.Any) -> tuple[t.Any, str]:
+    """
+    Unions and literals compare equal regardless of the order of their arguments
+    (e.g.: int | str == str | int) but that order is displayed to users, so the
+    type's repr is part of the key too
+    """
+    return (_type, repr(_type))
+
+
+# Commands are defined once, so the parsers built for their fields are shared
+# between all fields with the same type. `parsers.from_type` always returns new
+# instances so that users can safely modify them
+_from_type_cached = _type_util.cache_by_type(key=_parser_cache_key)(parsers.from_type)
 
 CLYPI_OPTIONS = "__clypi_options__"
 CLYPI_POSITIONALS = "__clypi_positionals__"
 CLYPI_IN_ORDER_FIELD_NAMES = "__clypi_in_order_field_names__"
 CLYPI_SUBCOMMANDS = "__clypi_subcommands__"
+CLYPI_SHORT_NAMES = "__clypi_short_names__"
+CLYPI_NEGATIVE_NAMES = "__clypi_negative_names__"
+CLYPI_PARSERS = "__clypi_parsers__"
+CLYPI_POSITIONAL_ORDER = "__clypi_positional_order__"
+CLYPI_OPTION_CANDIDATES = "__clypi_option_candidates__"
+CLYPI_POSITIONAL_CANDIDATES = "__clypi_positional_candidates__"
 CLYPI_PARENTS = "__clypi_parents__"
 CLYPI_UNPARSED = "__clypi_unparsed__"
+CLYPI_PROG = "__clypi_prog__"
+CLYPI_HELP = "__clypi_help__"
 
 
 def _camel_to_dashed(s: str):
-    return re.sub(r"(?<!^)(?=[A-Z])", "-", s).lower()
+    # Add a dash before every uppercase letter except the first one
+    chars: list[str] = []
+    for i, c in enumerate(s):
+        if i and "A" <= c <= "Z":
+            chars.append("-")
+        chars.append(c)
+    return "".join(chars).lower()
 
 
 class _CommandMeta(type):
@@ -59,16 +88,26 @@ class _CommandMeta(type):
         **kwds: t.Any,
     ) -> None:
         super(_CommandMeta, self).__init__(name, bases, attrs)
-        self._ensure_fields_are_annotated()
-        self._configure_fields()
-        self._configure_subcommands()
+        setattr(self, CLYPI_PROG, _camel_to_dashed(name))
+
+        # Evaluating the annotations is expensive so we only do it once
+        annotations: dict[str, t.Any] = inspect.get_annotations(self, eval_str=True)
+        self._ensure_fields_are_annotated(annotations)
+        self._configure_fields(annotations)
+        self._configure_subcommands(annotations)
+
+        # Names we'll suggest when the user makes a typo in a positional arg
+        positional_candidates = [
+            *[s for s in self.subcommands() if s],
+            *self.positionals(),
+        ]
+        setattr(self, CLYPI_POSITIONAL_CANDIDATES, positional_candidates)
 
     @t.final
-    def _ensure_fields_are_annotated(self) -> None:
+    def _ensure_fields_are_annotated(self, annotations: dict[str, t.Any]) -> None:
         """
         Ensures that every single field is annotated with type hints
         """
-        annotations: dict[str, t.Any] = inspect.get_annotations(self, eval_str=True)
         for name, value in self.__dict__.items():
             if (
                 not name.startswith("_")
@@ -79,13 +118,11 @@ class _CommandMeta(type):
                 raise TypeError(f"{name!r} has no type annotation")
 
     @t.final
-    def _configure_fields(self) -> None:
+    def _configure_fields(self, annotations: dict[str, t.Any]) -> None:
         """
         Parses the type hints from the class extending Command and assigns each
         a field Config with all the necessary info to display and parse them.
         """
-        annotations: dict[str, t.Any] = inspect.get_annotations(self, eval_str=True)
-
         # Mappings for each arg type
         options: dict[str, arg_config.Config[t.Any]] = {}
         positionals: dict[str, arg_config.Config[t.Any]] = {}
@@ -104,7 +141,7 @@ class _CommandMeta(type):
             if isinstance(default, arg_config.PartialConfig):
                 parser = default.parser
                 if not default.inherited:
-                    parser = parser or parsers.from_type(_type)
+                    parser = parser or _from_type_cached(_type)
                 field_conf = arg_config.Config.from_partial(
                     partial=default,
                     name=field,
@@ -116,7 +153,7 @@ class _CommandMeta(type):
                 field_conf = arg_config.Config(
                     name=field,
                     default=default,
-                    parser=parsers.from_type(_type),
+                    parser=_from_type_cached(_type),
                     arg_type=_type,
                 )
 
@@ -137,14 +174,46 @@ class _CommandMeta(type):
         setattr(self, CLYPI_OPTIONS, options)
         setattr(self, CLYPI_POSITIONALS, positionals)
         setattr(self, CLYPI_IN_ORDER_FIELD_NAMES, field_names)
+        self._index_fields()
 
     @t.final
-    def _configure_subcommands(self) -> None:
+    def _index_fields(self) -> None:
+        """
+        Builds the mappings from short and negative option names to the option's
+        field name, and from field names to their parsers, so that parsing doesn't
+        need to scan through all fields
+        """
+        short_names: dict[str, str] = {}
+        negative_names: dict[str, str] = {}
+        for field, field_conf in self.options().items():
+            if field_conf.short:
+                short_names[field_conf.short] = field
+            if field_conf.negative:
+                negative_names[field_conf.negative] = field
+
+        setattr(self, CLYPI_SHORT_NAMES, short_names)
+        setattr(self, CLYPI_NEGATIVE_NAMES, negative_names)
+
+        # Names we'll suggest when the user makes a typo in an option
+        option_candidates = [*self.options(), *short_names]
+        setattr(self, CLYPI_OPTION_CANDIDATES, option_candidates)
+
+        parsers_map: dict[str, parsers.Parser[t.Any]] = {
+            field: field_conf.parser
+            for fields in (self.options(), self.positionals())
+            for field, field_conf in fields.items()
+        }
+        setattr(self, CLYPI_PARSERS, parsers_map)
+
+        # Positionals in the order they need to be filled in
+        setattr(self, CLYPI_POSITIONAL_ORDER, tuple(self.positionals().values()))
+
+    @t.final
+    def _configure_subcommands(self, annotations: dict[str, t.Any]) -> None:
         """
         Parses the type hints from the class extending Command and stores the
         subcommand class if any
         """
-        annotations: dict[str, t.Any] = inspect.get_annotations(self, eval_str=True)
         if "subcommand" not in annotations:
             return
 
@@ -230,19 +299,25 @@ class _CommandMeta(type):
             for field, field_conf in parent_fields.items():
                 if field not in all_fields or not all_fields[field].inherited:
                     continue
-                all_fields[field] = dataclasses.replace(
-                    field_conf,
-                    # Keep inherited and group/hidden config
-                    inherited=True,
-                    group=all_fields[field].group or field_conf.group,
-                    hidden=all_fields[field].hidden or field_conf.hidden,
-                )
+                # Shallow copy instead of `dataclasses.replace` since nothing
+                # that needs to be re-derived from the type hints changes
+                child_conf = all_fields[field]
+                new_conf = copy.copy(field_conf)
+
+                # Keep inherited and group/hidden config
+                new_conf.inherited = True
+                new_conf.group = child_conf.group or field_conf.group
+                new_conf.hidden = child_conf.hidden or field_conf.hidden
+                all_fields[field] = new_conf
                 inherited.add(field)
 
         # For inherited args, configure them with the parent's configs
         _merge(self.options(), parent.options())
         _merge(self.positionals(), parent.positionals())
 
+        # Inherited fields might have brought in new names or parsers
+        self._index_fields()
+
         return inherited
 
     @t.final
@@ -286,33 +361,50 @@ class Command(metaclass=_CommandMeta):
         from type hints to real variables.
         """
         fields: dict[str, t.Any] = {}
-
-        # Reversed so that we can `.pop()` in order
-        field_names = list(reversed(self.__class__.field_names()))
-        arg_ls = list(reversed(args))
+        field_names = self.__class__.field_names()
 
         # From *args
-        while arg_ls:
-            fields[field_names.pop()] = arg_ls.pop()
+        for i, value in enumerate(args):
+            fields[field_names[i]] = value
 
         # From *kwargs
+        remaining = set(field_names[len(args) :])
         for k, v in kwargs.items():
             if k in fields:
                 raise TypeError(
                     f"Found duplicate field {k} for {self.__class__.__name__}"
                 )
-            if k not in field_names:
+            if k not in remaining:
                 raise TypeError(f"Invalid argument {k} for {self.__class__.__name__}")
 
             fields[k] = v
-            field_names.remove(k)
 
         # Validate all fields and populate defaults
         validated = self._validate_fields(fields, name=self.__class__.__name__)
 
-        # Save all fields to current instance
-        for k, v in validated.items():
-            setattr(self, k, v)
+        self._set_fields(validated)
+
+    def _set_fields(self, validated: dict[str, t.Any]) -> None:
+        """
+        Saves all fields to the current instance. Commands can't use `__slots__`
+        since the class attributes with the same names hold each field's
+        default, so values always live in `__dict__`
+        """
+        vars(self).update(validated)
+
+    @classmethod
+    def _construct_prevalidated(cls, validated: dict[str, t.Any]) -> t.Self:
+        """
+        Builds an instance from fields already checked by `_validate_fields`,
+        skipping `__init__` so that they are not validated a second time. Commands
+        that override `__init__` still go through it
+        """
+        if cls.__init__ is not Command.__init__:
+            return cls(**validated)
+
+        obj = object.__new__(cls)
+        obj._set_fields(validated)
+        return obj
 
     @classmethod
     def _validate_fields(cls, fields: dict[str, t.Any], name: str) -> dict[str, t.Any]:
@@ -366,7 +458,7 @@ class Command(metaclass=_CommandMeta):
         """
         The name of the command being executed. E.g.: install
         """
-        return _camel_to_dashed(cls.__name__)
+        return getattr(cls, CLYPI_PROG)
 
     @t.final
     @classmethod
@@ -374,7 +466,7 @@ class Command(metaclass=_CommandMeta):
         """
         The full path to the current command being ran. E.g.: pip install
         """
-        return cls.parents() + [cls.prog()]
+        return [*cls.parents(), cls.prog()]
 
     @classmethod
     def epilog(cls) -> str | None:
@@ -404,8 +496,12 @@ class Command(metaclass=_CommandMeta):
         """
         A brief description for the command
         """
-        doc = inspect.getdoc(cls) or ""
-        return doc.replace("\n", " ")
+        # Looked up in the class' own dict so that subclasses don't reuse
+        # their parent's cached docs
+        if (doc := cls.__dict__.get(CLYPI_HELP)) is None:
+            doc = (inspect.getdoc(cls) or "").replace("\n", " ")
+            setattr(cls, CLYPI_HELP, doc)
+        return doc
 
     async def pre_run_hook(self) -> None:
         """
@@ -464,41 +560,29 @@ class Command(metaclass=_CommandMeta):
 
     @t.final
     def start(self) -> Exception | None:
+        # Only needed to run the command so we avoid importing it on startup
+        import asyncio
+
         return asyncio.run(self.astart())
 
     @t.final
     @classmethod
-    def _next_positional(cls, kwargs: dict[str, t.Any]) -> Config[t.Any] | None:
+    def _next_positional(
+        cls,
+        kwargs: dict[str, t.Any],
+        positional_order: tuple[Config[t.Any], ...],
+    ) -> Config[t.Any] | None:
         """
         Traverse the current collected arguments and find the next positional
         arg we can assign to.
         """
-        for name, pos in cls.positionals().items():
+        for pos in positional_order:
             # List positionals are a catch-all
-            if _type_util.is_list(pos.arg_type):
-                return pos
-
-            if name not in kwargs:
+            if pos.is_list or pos.name not in kwargs:
                 return pos
 
         return None
 
-    @t.final
-    @classmethod
-    def _get_long_name(cls, short: str) -> str | None:
-        for field, field_conf in cls.options().items():
-            if field_conf.short == short:
-                return field
-        return None
-
-    @t.final
-    @classmethod
-    def _get_positive_name(cls, negative_opt: str) -> str | None:
-        for field, field_conf in cls.options().items():
-            if field_conf.negative == negative_opt:
-                return field
-        return None
-
     @t.final
     @classmethod
     def get_similar_arg_error(cls, arg: arg_parser.Arg) -> ValueError:
@@ -508,26 +592,19 @@ class Command(metaclass=_CommandMeta):
         """
         similar = None
 
-        if arg.is_pos():
-            all_pos: list[str] = [
-                *[s for s in cls.subcommands() if s],
-                *list(cls.positionals()),
-            ]
-            pos, dist = closest(arg.value, all_pos)
-            # 2 is ~good for typos (e.g.: this -> that)
-            if dist <= 2:
+        is_pos = arg.arg_type == "pos"
+        if is_pos:
+            all_pos: list[str] = getattr(cls, CLYPI_POSITIONAL_CANDIDATES)
+            pos, dist = closest(arg.value, all_pos, max_dist=MAX_TYPO_DISTANCE)
+            if dist <= MAX_TYPO_DISTANCE:
                 similar = pos
         else:
-            all_pos: list[str] = [
-                *list(cls.options()),
-                *[o.short for o in cls.options().values() if o.short],
-            ]
-            pos, dist = closest(arg.value, all_pos)
-            # 2 is ~good for typos (e.g.: this -> that)
-            if dist <= 2:
+            all_pos: list[str] = getattr(cls, CLYPI_OPTION_CANDIDATES)
+            pos, dist = closest(arg.value, all_pos, max_dist=MAX_TYPO_DISTANCE)
+            if dist <= MAX_TYPO_DISTANCE:
                 similar = f"--{pos}" if len(pos) > 1 else f"-{pos}"
 
-        what = "argument" if arg.is_pos() else "option"
+        what = "argument" if is_pos else "option"
         error = f"Unknown {what} {arg.orig!r}"
         if similar is not None:
             error += f". Did you mean {similar!r}?"
@@ -540,13 +617,14 @@ class Command(metaclass=_CommandMeta):
         cls,
         args: t.Iterator[str],
         parent_attrs: dict[str, str | list[str]] | None = None,
+        requested_help: bool = False,
     ) -> t.Self:
         """
         Tries parsing args and if an error is shown, it displays the subcommand
         that failed the parsing's help page.
         """
         try:
-            return cls._parse(args, parent_attrs)
+            return cls._parse(args, parent_attrs, requested_help)
         except parsers.CATCH_ERRORS as e:
             if not get_config().help_on_fail:
                 raise
@@ -566,6 +644,7 @@ class Command(metaclass=_CommandMeta):
         cls,
         args: t.Iterator[str],
         parent_attrs: dict[str, str | list[str]] | None = None,
+        requested_help: bool = False,
     ) -> t.Self:
         """
         Given an iterator of arguments we recursively parse all options, arguments,
@@ -576,6 +655,17 @@ class Command(metaclass=_CommandMeta):
         """
         parent_attrs = parent_attrs or {}
 
+        # Bind the class-level metadata once since it's used for every argument
+        options = cls.options()
+        positionals = cls.positionals()
+        subcommands = cls.subcommands()
+        parsers_map: dict[str, parsers.Parser[t.Any]] = getattr(cls, CLYPI_PARSERS)
+        positional_order: tuple[Config[t.Any], ...] = getattr(
+            cls, CLYPI_POSITIONAL_ORDER
+        )
+        short_names: dict[str, str] = getattr(cls, CLYPI_SHORT_NAMES)
+        negative_names: dict[str, str] = getattr(cls, CLYPI_NEGATIVE_NAMES)
+
         # An accumulator to store unparsed arguments for this class
         unparsed: dict[str, str | list[str]] = {}
 
@@ -593,9 +683,6 @@ class Command(metaclass=_CommandMeta):
         # The subcommand we need to parse
         subcommand: type[Command] | None = None
 
-        # If the user is trying to display the help page we can skip some parts
-        requested_help = sys.argv[-1].lower() in HELP_ARGS
-
         # Parse the cmd line arguments
         for unparsed_arg in args:
             # Double dash means stop parsing
@@ -604,23 +691,26 @@ class Command(metaclass=_CommandMeta):
                 break
 
             parsed = arg_parser.parse_as_attr(unparsed_arg)
+            arg_type = parsed.arg_type
+            is_pos = arg_type == "pos"
+            is_long_opt = arg_type == "long-opt"
+            is_short_opt = arg_type == "short-opt"
 
             # If we've reached -h or --help
-            if parsed.orig.lower() in HELP_ARGS:
+            orig = parsed.orig
+            if orig[:1] in _HELP_ARGS_FIRST_CHARS and orig.lower() in HELP_ARGS:
                 cls.print_help()
 
             # Try to parse as a subcommand
-            if parsed.is_pos() and parsed.value in cls.subcommands():
-                subcommand = cls.subcommands()[parsed.value]
+            if is_pos and parsed.value in subcommands:
+                subcommand = subcommands[parsed.value]
                 break
 
             # ---- Try to set to the current option ----
-            is_valid_long = parsed.is_long_opt() and parsed.value in cls.options()
-            maybe_positive_name = parsed.is_long_opt() and cls._get_positive_name(
-                parsed.value
-            )
-            maybe_long_name = parsed.is_short_opt() and cls._get_long_name(parsed.value)
-            if parsed.is_opt() and not (
+            is_valid_long = is_long_opt and parsed.value in options
+            maybe_positive_name = is_long_opt and negative_names.get(parsed.value)
+            maybe_long_name = is_short_opt and short_names.get(parsed.value)
+            if not is_pos and not (
                 is_valid_long or maybe_positive_name or maybe_long_name
             ):
                 raise cls.get_similar_arg_error(parsed)
@@ -631,7 +721,7 @@ class Command(metaclass=_CommandMeta):
                 # - Negative flags: --no-verbose -> verbose
                 # - Normal long opts: --verbose -> verbose
                 long_name = maybe_long_name or maybe_positive_name or parsed.value
-                option = cls.options()[long_name]
+                option = options[long_name]
                 flush_ctx()
 
                 # Boolean flags don't need to parse more args later on
@@ -642,7 +732,9 @@ class Command(metaclass=_CommandMeta):
                 continue
 
             # Try to assign to the current positional
-            if not current_attr.name and (pos := cls._next_positional(unparsed)):
+            if not current_attr.name and (
+                pos := cls._next_positional(unparsed, positional_order)
+            ):
                 current_attr = CurrentCtx(pos.name, pos.nargs, pos.nargs)
 
             # Try to assign to the current ctx
@@ -668,15 +760,17 @@ class Command(metaclass=_CommandMeta):
             for field in cls.field_names():
                 if field == "subcommand":
                     continue
-                field_conf = cls.get_field_conf(field)
+                field_conf = positionals.get(field) or options[field]
 
                 # If the field was provided through args
                 if field in unparsed:
-                    parsed_kwargs[field] = field_conf.parser(unparsed[field])
+                    parsed_kwargs[field] = parsers_map[field](unparsed[field])
 
                 # If the field can come from an env var, check that
                 elif field_conf.env is not None and field_conf.env in os.environ:
-                    parsed_kwargs[field] = field_conf.parser(os.environ[field_conf.env])
+                    parsed_kwargs[field] = parsers_map[field](
+                        os.environ[field_conf.env]
+                    )
 
                 # If the field comes from a parent command, use that
                 elif field_conf.inherited and field in parent_attrs:
@@ -712,7 +806,11 @@ class Command(metaclass=_CommandMeta):
         # Parse the subcommand passing in the parsed types and borrow the
         # inherited fields it parsed for us
         if subcommand:
-            subcmd_instance = subcommand._safe_parse(args, parent_attrs=parsed_kwargs)
+            subcmd_instance = subcommand._safe_parse(
+                args,
+                parent_attrs=parsed_kwargs,
+                requested_help=requested_help,
+            )
             parsed_kwargs["subcommand"] = subcmd_instance
 
             # If any fields were inherited by the subcommand and populated there,
@@ -722,7 +820,7 @@ class Command(metaclass=_CommandMeta):
 
         # Initialize the instance
         validated = cls._validate_fields(parsed_kwargs, name=cls.prog())
-        return cls(**validated)
+        return cls._construct_prevalidated(validated)
 
     @t.final
     @classmethod
@@ -743,7 +841,10 @@ class Command(metaclass=_CommandMeta):
 
         norm_args = arg_parser.normalize_args(args)
         args_iter = iter(norm_args)
-        instance = cls._safe_parse(args_iter)
+
+        # If the user is trying to display the help page we can skip some parts
+        requested_help = sys.argv[-1].lower() in HELP_ARGS
+        instance = cls._safe_parse(args_iter, requested_help=requested_help)
         if autocomplete.get_autocomplete_args() is not None:
             autocomplete.list_arguments(cls)
         if list(args_iter):
@@ -71,18 +71,26 @@ def _color_code(color: ColorType, offset: int) -> int:
     return _color_codes[key] + offset
 
 
-def _apply_color(s: str, color: ColorType, offset: int) -> str:
-    start = _color_code(color, offset)
-    end = _color_code("default", offset)
-    return f"{_code(start)}{s}{_code(end)}"
+def _build_escapes(offset: int) -> dict[str, tuple[str, str]]:
+    """
+    Precomputes the escape sequences that turn each color on and off
+    """
+    end = _code(_color_code("default", offset))
+    return {color: (_code(_color_code(color, offset)), end) for color in ALL_COLORS}
+
+
+_FG_ESCAPES = _build_escapes(FG_OFFSET)
+_BG_ESCAPES = _build_escapes(BG_OFFSET)
 
 
 def _apply_fg(text: str, fg: ColorType):
-    return _apply_color(text, fg, FG_OFFSET)
+    start, end = _FG_ESCAPES[fg]
+    return start + text + end
 
 
 def _apply_bg(text: str, bg: ColorType):
-    return _apply_color(text, bg, BG_OFFSET)
+    start, end = _BG_ESCAPES[bg]
+    return start + text + end
 
 
 class StyleCode(Enum):
@@ -105,6 +113,9 @@ def _reset(s: str) -> str:
 
 
 def remove_style(s: str):
+    # Every escape sequence starts with ESC so plain strings can skip the regex
+    if "\x1b" not in s:
+        return s
     return ANSI_ESCAPE.sub("", s)
 
 
@@ -115,7 +126,7 @@ def _should_disable_colors() -> bool:
     return get_config().disable_colors
 
 
-@dataclass
+@dataclass(slots=True)
 class Styler:
     fg: ColorType | None = None
     bg: ColorType | None = None
@@ -134,7 +145,11 @@ class Styler:
         if self.hide:
             return ""
 
-        text = " ".join(str(m) for m in messages)
+        # Most calls style a single string (e.g.: the help page's option names)
+        if len(messages) == 1 and type(messages[0]) is str:
+            text = messages[0]
+        else:
+            text = " ".join(str(m) for m in messages)
 
         # If the user wants to disable colors, never format
         if _should_disable_colors():
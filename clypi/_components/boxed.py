@@ -24,33 +24,36 @@ def boxed(
     box = style.value
     c = Styler(fg=color)
 
-    def _iter_box(
+    def _build_box(
         lines: t.Iterable[str],
         width: int,
-    ):
+    ) -> list[str]:
+        # Shared by the footer and the top bar when there's no title
+        horizontal = box.x * (width - 2)
+
         # Top bar
-        nonlocal title
-        top_bar_width = width - 3
         if title:
             top_bar_width = width - 5 - visible_width(title)
-            title = f" {title} "
+            top = box.x + f" {title} " + box.x * top_bar_width
         else:
-            title = ""
-        yield c(box.tl + box.x + title + box.x * top_bar_width + box.tr)
+            top = horizontal
+        rows = [c(box.tl + top + box.tr)]
 
         # Body
+        # Remove two on each side due to the box edge and padding
+        max_text_width = -2 + width - 2
+        left_bar = c(box.y) + " "
+        right_bar = " " + c(box.y)
         for line in lines:
-            # Remove two on each side due to the box edge and padding
-            max_text_width = -2 + width - 2
-
             # Wrap it in case each line is longer than expected
             wrapped = wrap(line, max_text_width)
             for sub_line in wrapped:
                 aligned = _align(sub_line, align, max_text_width)
-                yield c(box.y) + " " + aligned + " " + c(box.y)
+                rows.append(left_bar + aligned + right_bar)
 
         # Footer
-        yield c(box.bl + box.x * (width - 2) + box.br)
+        rows.append(c(box.bl + horizontal + box.br))
+        return rows
 
     def _get_width(lines: list[str]):
         if isinstance(width, int) and width >= 0:
@@ -68,8 +71,8 @@ def boxed(
 
     if isinstance(lines, list):
         computed_width = _get_width(lines)
-        return t.cast(T, list(_iter_box(lines, width=computed_width)))
+        return t.cast(T, _build_box(lines, width=computed_width))
 
     act_lines = lines.split("\n")
     computed_width = _get_width(act_lines)
-    return t.cast(T, "\n".join(_iter_box(act_lines, width=computed_width)))
+    return t.cast(T, "\n".join(_build_box(act_lines, width=computed_width)))
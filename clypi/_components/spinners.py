@@ -2,7 +2,7 @@ import asyncio
 import io
 import sys
 import typing as t
-from contextlib import AbstractAsyncContextManager, AbstractContextManager, suppress
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
 from types import TracebackType
 
 from typing_extensions import override
@@ -13,6 +13,7 @@ from clypi._data.spinners import Spin as _Spin
 
 MOVE_START = f"{ESC}1G"
 DEL_LINE = f"{ESC}0K"
+CLEAR_LINE = MOVE_START + DEL_LINE
 
 Spin = _Spin
 
@@ -27,7 +28,11 @@ class _PerLineIO(io.TextIOBase):
         super().__init__()
         self._new_line_cb = new_line_cb
         self._closed = False
-        self.buffer: list[str] = []
+
+        # Chunks of the last line written, which is incomplete until we get a
+        # new line. Kept in a list since repeatedly concatenating to an attribute
+        # copies the whole line on every write
+        self._pending: list[str] = []
 
     @override
     def write(self, s: str, /) -> int:
@@ -35,18 +40,24 @@ class _PerLineIO(io.TextIOBase):
         When we get a string, split it by new lines, submit every line we've
         collected and keep the remainder for future writes
         """
-        parts = s.split("\n")
-
-        # If there's a buffer, there's a half-way sentence there, so we merge it
-        if self.buffer:
-            self.buffer[0] += parts[0]
-            self.buffer.extend(parts[1:])
-        else:
-            self.buffer = parts
-
-        while len(self.buffer) > 1:
-            self._new_line_cb(self.buffer[0])
-            self.buffer = self.buffer[1:]
+        if "\n" not in s:
+            if s:
+                self._pending.append(s)
+            return 0
+
+        # The first line continues whatever was left over from previous writes
+        if self._pending:
+            self._pending.append(s)
+            s = "".join(self._pending)
+            self._pending.clear()
+
+        # Anything after the last new line is incomplete so it's kept for later
+        *lines, tail = s.split("\n")
+        for line in lines:
+            # Lines ending in `\r\n` (e.g.: from Windows programs)
+            self._new_line_cb(line.removesuffix("\r"))
+        if tail:
+            self._pending.append(tail)
 
         return 0
 
@@ -55,9 +66,9 @@ class _PerLineIO(io.TextIOBase):
         """
         If flush is called, print whatever we have even if there's no new line
         """
-        if self.buffer and not self._closed:
-            self._new_line_cb(self.buffer[0])
-        self.buffer = []
+        if self._pending and not self._closed:
+            self._new_line_cb("".join(self._pending))
+        self._pending.clear()
 
     @override
     def close(self) -> None:
@@ -108,6 +119,10 @@ class RedirectStdPipe(AbstractContextManager[None]):
         self._original.flush()
 
 
+# How many bytes to read from a pipe at a time
+_PIPE_CHUNK_SIZE = 2**16
+
+
 @t.final
 class Spinner(AbstractAsyncContextManager["Spinner"]):
     def __init__(
@@ -128,14 +143,19 @@ class Spinner(AbstractAsyncContextManager["Spinner"]):
         """
 
         self.animation = animation
+        self._frames: list[str] = (
+            animation.value if isinstance(animation, Spin) else animation
+        )
+        self._num_frames = len(self._frames)
         self.prefix = prefix
         self.suffix = suffix
         self.title = title
 
-        self._task: asyncio.Task[None] | None = None
+        self._timer: asyncio.TimerHandle | None = None
+        self._next_frame_at: float = 0
         self._manual_exit: bool = False
         self._frame_idx: int = 0
-        self._refresh_rate = 0.7 / speed / len(self._frames)
+        self._refresh_rate = 0.7 / speed / self._num_frames
 
         # For capturing stdout, stderr
         self._capture = capture
@@ -149,7 +169,8 @@ class Spinner(AbstractAsyncContextManager["Spinner"]):
             self._stdout.start()
             self._stderr.start()
 
-        self._task = asyncio.create_task(self._spin())
+        self._next_frame_at = asyncio.get_running_loop().time()
+        self._tick()
         return self
 
     @override
@@ -165,7 +186,7 @@ class Spinner(AbstractAsyncContextManager["Spinner"]):
         if self._manual_exit:
             return None
 
-        if any([exc_type, exc_value, traceback]):
+        if exc_type is not None:
             await self.fail()
         else:
             await self.done()
@@ -185,12 +206,8 @@ class Spinner(AbstractAsyncContextManager["Spinner"]):
 
         output_pipe = self._stderr if self._output == "stderr" else self._stdout
 
-        # Wipe the line for next render
-        output_pipe.write(MOVE_START)
-        output_pipe.write(DEL_LINE)
-
-        # Write msg and flush
-        output_pipe.write(msg)
+        # Wipe the line for next render, write msg and flush
+        output_pipe.write(CLEAR_LINE + msg)
         output_pipe.flush()
 
     def _render_frame(self):
@@ -200,23 +217,30 @@ class Spinner(AbstractAsyncContextManager["Spinner"]):
             color="blue",
         )
 
-    @property
-    def _frames(self) -> list[str]:
-        return (
-            self.animation.value if isinstance(self.animation, Spin) else self.animation
-        )
+    def _tick(self) -> None:
+        """
+        Renders the next frame and schedules the one after it. A timer callback
+        is cheaper than a task looping over `asyncio.sleep` since the event loop
+        only has to wake up to run this.
 
-    async def _spin(self) -> None:
-        while True:
-            self._frame_idx = (self._frame_idx + 1) % len(self._frames)
-            self._render_frame()
-            await asyncio.sleep(self._refresh_rate)
+        Frames are scheduled at absolute times so that the time spent rendering
+        doesn't add up over a long spinner. If the loop was busy for longer than
+        a frame, the missed frames are skipped instead of drawn all at once
+        """
+        self._frame_idx = (self._frame_idx + 1) % self._num_frames
+        self._render_frame()
+
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        self._next_frame_at += self._refresh_rate
+        if self._next_frame_at <= now:
+            self._next_frame_at = now + self._refresh_rate
+        self._timer = loop.call_at(self._next_frame_at, self._tick)
 
     async def _exit(self, msg: str | None = None, success: bool = True):
-        if t := self._task:
-            t.cancel()
-            with suppress(asyncio.CancelledError):
-                await t
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
 
         # Stop capturing stdout/stderrr
         if self._capture:
@@ -235,6 +259,16 @@ class Spinner(AbstractAsyncContextManager["Spinner"]):
         self._manual_exit = True
         await self._exit(msg, success=False)
 
+    def reset(self, title: str, msg: str | None = None) -> None:
+        """
+        Mark the current step as done and keep spinning with a new title. Cheaper
+        than entering a new spinner for every step since the animation and the
+        stdout/stderr capture keep running
+        """
+        self._print(msg or self.title, icon="✔", color="green", end="\n")
+        self.title = title
+        self._render_frame()
+
     def log(
         self,
         msg: str,
@@ -261,14 +295,33 @@ class Spinner(AbstractAsyncContextManager["Spinner"]):
         if not pipe:
             return
 
-        while True:
-            line = await pipe.readline()
-            if not line:
-                break
-
+        def _log_line(line: bytes) -> None:
             msg = f"{prefix} {line.decode()}" if prefix else line.decode()
             self.log(msg, color=color)
 
+        # Read whatever is available at once instead of awaiting every line so
+        # that bursts of output only take one trip through the event loop
+        # Chunks of the last incomplete line, only joined once it's complete
+        pending: list[bytes] = []
+        while chunk := await pipe.read(_PIPE_CHUNK_SIZE):
+            if b"\n" not in chunk:
+                pending.append(chunk)
+                continue
+
+            if pending:
+                pending.append(chunk)
+                chunk = b"".join(pending)
+                pending.clear()
+
+            *lines, tail = chunk.split(b"\n")
+            for line in lines:
+                _log_line(line)
+            if tail:
+                pending.append(tail)
+
+        if pending:
+            _log_line(b"".join(pending))
+
 
 P = t.ParamSpec("P")
 R = t.TypeVar("R")
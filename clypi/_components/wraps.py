@@ -1,11 +1,19 @@
 import textwrap
 import typing as t
+from functools import lru_cache
 
 from clypi._util import UNSET, Unset, visible_width
 
 OverflowStyle = t.Literal["ellipsis", "wrap"]
 
 
+@lru_cache(maxsize=32)
+def _get_wrapper(width: int) -> textwrap.TextWrapper:
+    # Wrappers hold no state between calls, and callers like `boxed` wrap
+    # every line with the same width, so they're reused instead of rebuilt
+    return textwrap.TextWrapper(width=width)
+
+
 def wrap(
     s: str, width: int, overflow_style: OverflowStyle | Unset = UNSET
 ) -> list[str]:
@@ -13,7 +21,9 @@ def wrap(
     If a string is larger than width, it either wraps the string into new
     lines or appends an ellipsis
     """
-    if visible_width(s) <= width:
+    # Unstyled strings are as wide as they are long, so skip stripping escapes
+    vis_width = len(s) if "\x1b" not in s else visible_width(s)
+    if vis_width <= width:
         return [s]
 
     if overflow_style is UNSET:
@@ -24,4 +34,4 @@ def wrap(
     if overflow_style == "ellipsis":
         return [s[: width - 1] + "…"]
 
-    return textwrap.wrap(s, width=width)
+    return _get_wrapper(width).wrap(s)
@@ -0,0 +1,2 @@
+# Kept free of imports so that any module can depend on it cheaply
+MAX_ATTEMPTS: int = 20
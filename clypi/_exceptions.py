@@ -1,6 +1,3 @@
-import typing as t
-from dataclasses import dataclass, field
-
 from clypi._colors import ColorType, style
 
 
@@ -20,43 +17,28 @@ class AbortException(ClypiException):
     pass
 
 
-@dataclass
-class TreeExcNode:
-    exc: BaseException
-    children: list[t.Self] = field(default_factory=list)
-
-
-def _build_exc_tree(err: BaseException) -> TreeExcNode:
-    root = TreeExcNode(err)
-
-    # Add __cause__ levels
-    if err.__cause__ is not None:
-        root.children.append(_build_exc_tree(err.__cause__))
-
-    # Add exception group levels
-    if isinstance(err, ExceptionGroup):
-        for sub_exc in err.exceptions:
-            root.children.append(_build_exc_tree(sub_exc))
-
-    return root
-
-
 def format_traceback(err: BaseException, color: ColorType | None = "red") -> list[str]:
     def _format_exc(e: BaseException, indent: int):
         msg = e.args[0] if e.args else str(err.__class__.__name__)
         icon = "  " * (indent - 1) + " ↳ " if indent != 0 else ""
         return style(f"{icon}{str(msg)}", fg=color)
 
-    def _print_level(tree: TreeExcNode, indent: int) -> list[str]:
-        ret: list[str] = []
-        for child_node in tree.children:
-            ret.append(_format_exc(child_node.exc, indent))
-            ret.extend(_print_level(child_node, indent=indent + 1))
-        return ret
+    lines: list[str] = []
+
+    # Walk the causes and exception groups depth first, formatting as we go
+    def _format_level(e: BaseException, indent: int):
+        lines.append(_format_exc(e, indent))
+
+        # Add __cause__ levels
+        if e.__cause__ is not None:
+            _format_level(e.__cause__, indent + 1)
+
+        # Add exception group levels
+        if isinstance(e, ExceptionGroup):
+            for sub_exc in e.exceptions:
+                _format_level(sub_exc, indent + 1)
 
-    tree = _build_exc_tree(err)
-    lines = [_format_exc(tree.exc, indent=0)]
-    lines.extend(_print_level(tree, indent=1))
+    _format_level(err, indent=0)
     return lines
 
 
@@ -7,23 +7,21 @@ from getpass import getpass
 import clypi
 from clypi import parsers
 from clypi._configuration import get_config
+from clypi._constants import MAX_ATTEMPTS
 from clypi._exceptions import AbortException, MaxAttemptsException
 from clypi._util import UNSET, Unset
 
-MAX_ATTEMPTS: int = 20
-
 
 def _error(msg: str):
     clypi.cprint(msg, fg="red")
 
 
-def _input(prompt: str, hide_input: bool = False) -> str:
+def _input(styled_prompt: str, hide_input: bool = False) -> str:
     """
     Prompts the user for a value or uses the default and returns the
     value and if we're using the default
     """
     fun = getpass if hide_input else input
-    styled_prompt = get_config().theme.prompts(prompt)
     return fun(styled_prompt)
 
 
@@ -118,8 +116,8 @@ def prompt(
     if default_factory is not UNSET:
         default = default_factory()
 
-    # Build the prompt
-    prompt = _build_prompt(text, default)
+    # Build and style the prompt once for all attempts
+    prompt = get_config().theme.prompts(_build_prompt(text, default))
 
     # Loop until we get a valid value
     for _ in range(max_attempts):
@@ -18,6 +18,51 @@ def ignore_annotated(fun: t.Callable[P, R]) -> t.Callable[P, R]:
     return inner
 
 
+@t.overload
+def cache_by_type(fun: t.Callable[[t.Any], R], /) -> t.Callable[[t.Any], R]: ...
+
+
+@t.overload
+def cache_by_type(
+    *, key: t.Callable[[t.Any], t.Hashable]
+) -> t.Callable[[t.Callable[[t.Any], R]], t.Callable[[t.Any], R]]: ...
+
+
+def cache_by_type(
+    fun: t.Callable[[t.Any], R] | None = None,
+    /,
+    *,
+    key: t.Callable[[t.Any], t.Hashable] | None = None,
+) -> t.Any:
+    """
+    Memoizes a function that only depends on the type it receives. Types with
+    unhashable metadata (e.g.: Annotated[int, {}]) are computed every time.
+
+    `key` can be used to cache by something other than the type itself
+    """
+
+    def decorator(fun: t.Callable[[t.Any], R]) -> t.Callable[[t.Any], R]:
+        cache: dict[t.Any, R] = {}
+
+        def inner(_type: t.Any) -> R:
+            cache_key = _type if key is None else key(_type)
+            try:
+                return cache[cache_key]
+            except KeyError:
+                pass
+            except TypeError:
+                return fun(_type)
+
+            res = cache[cache_key] = fun(_type)
+            return res
+
+        return inner
+
+    if fun is None:
+        return decorator
+    return decorator(fun)
+
+
 @ignore_annotated
 def is_list(_type: t.Any) -> t.TypeGuard[list[t.Any]]:
     return t.get_origin(_type) in (list, t.Sequence)
@@ -80,10 +125,13 @@ def literal_inner(_type: t.Any) -> list[t.Any]:
 
 
 @ignore_annotated
-def tuple_size(_type: t.Any) -> float:
+def tuple_size(_type: t.Any) -> int | None:
+    """
+    Returns how many items the tuple accepts or None if it's unbounded
+    """
     args = _type.__args__
     if args[-1] is Ellipsis:
-        return float("inf")
+        return None
     return len(args)
 
 
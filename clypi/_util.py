@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 from enum import Enum, auto
+from functools import lru_cache
 
 from clypi._colors import remove_style
 
@@ -13,6 +14,9 @@ class Unset(Enum):
 UNSET = Unset.TOKEN
 
 
+# Components measure the same cells over and over (e.g.: to align columns), so
+# the widths of recently seen strings are kept around
+@lru_cache(maxsize=4096)
 def visible_width(s: str) -> int:
     s = remove_style(s)
     return len(s)
@@ -22,6 +26,8 @@ def get_term_width():
     if width := os.getenv("CLYPI_TERM_WIDTH"):
         return int(width)
 
+    # Not cached since the terminal can be resized at any time. Components
+    # measure it once per render instead
     try:
         return os.get_terminal_size().columns
     except OSError:
@@ -178,8 +178,8 @@ class Float(ClypiParser[float]):
 
 
 class Bool(ClypiParser[bool]):
-    TRUE_BOOL_STR_LITERALS: set[str] = {"true", "yes", "y"}
-    FALSE_BOOL_STR_LITERALS: set[str] = {"false", "no", "n"}
+    TRUE_BOOL_STR_LITERALS: frozenset[str] = frozenset(("true", "yes", "y"))
+    FALSE_BOOL_STR_LITERALS: frozenset[str] = frozenset(("false", "no", "n"))
 
     @override
     def __call__(self, raw: str | list[str], /) -> bool:
@@ -187,12 +187,16 @@ class Bool(ClypiParser[bool]):
             raise CannotParseAs(raw, self)
 
         raw_lower = raw.lower()
-        both = self.TRUE_BOOL_STR_LITERALS | self.FALSE_BOOL_STR_LITERALS
-        if raw_lower not in both:
-            raise ValueError(
-                f"The string {raw!r} is not valid boolean! The only allowed values are: {both}."
-            )
-        return raw_lower in self.TRUE_BOOL_STR_LITERALS
+        if raw_lower in self.TRUE_BOOL_STR_LITERALS:
+            return True
+        if raw_lower in self.FALSE_BOOL_STR_LITERALS:
+            return False
+
+        # Only build the set of all valid values when there's an error to show
+        both = {*self.TRUE_BOOL_STR_LITERALS, *self.FALSE_BOOL_STR_LITERALS}
+        raise ValueError(
+            f"The string {raw!r} is not valid boolean! The only allowed values are: {both}."
+        )
 
     @override
     def __repr__(self):
@@ -244,23 +248,47 @@ class Str(ClypiParser[str]):
 
         return raw
 
+    def is_passthrough(self) -> bool:
+        """
+        Whether parsing a string returns it unchanged (i.e.: nothing to validate)
+        """
+        return (
+            self.length is None
+            and self.max is None
+            and self.min is None
+            and self.startswith is None
+            and self.endswith is None
+            and self.regex is None
+        )
+
     @override
     def __repr__(self) -> str:
         return "text"
 
 
+# dateutil is slow to import so it's only loaded the first time a date is parsed
+_dateutil_parse: t.Callable[[str], datetime] | None = None
+
+
+def _parse_datetime(raw: str) -> datetime:
+    global _dateutil_parse
+    if _dateutil_parse is None:
+        from dateutil.parser import parse
+
+        _dateutil_parse = parse
+    return _dateutil_parse(raw)
+
+
 @dataclass
 class DateTime(ClypiParser[datetime]):
     tz: timezone | None = None
 
     @override
     def __call__(self, raw: str | list[str], /) -> datetime:
-        from dateutil.parser import parse
-
         if isinstance(raw, list):
             raise CannotParseAs(raw, self)
 
-        parsed = parse(raw)
+        parsed = _parse_datetime(raw)
         if self.tz is not None:
             if parsed.tzinfo:
                 parsed = parsed.astimezone(tz=self.tz)
@@ -292,7 +320,11 @@ class TimeDelta(ClypiParser[timedelta]):
         ("milliseconds", "millisecond", "ms"): "milliseconds",
         ("microseconds", "microsecond", "us"): "microseconds",
     }
-    TIMEDELTA_REGEX = re.compile(r"^(\d+)\s*(\w+)$")
+    # Flattened so that each unit is a single lookup (e.g.: "w" -> "weeks")
+    _TIMEDELTA_UNIT_ALIASES = {
+        alias: unit for aliases, unit in TIMEDELTA_UNITS.items() for alias in aliases
+    }
+    TIMEDELTA_REGEX = re.compile(r"(\d+)\s*(\w+)")
 
     @override
     def __call__(self, raw: str | list[str], /) -> timedelta:
@@ -304,19 +336,16 @@ class TimeDelta(ClypiParser[timedelta]):
                 f"Cannot parse {raw!r} as timedelta. Expected str or timedelta, got {type(raw).__name__}"
             )
 
-        match = self.TIMEDELTA_REGEX.match(raw)
+        # A trailing new line is allowed (e.g.: values read from a file)
+        match = self.TIMEDELTA_REGEX.fullmatch(raw.removesuffix("\n"))
         if match is None:
             raise ValueError(f"Invalid timedelta {raw!r}.")
 
         value, unit = match.groups()
-        parsed = None
-        for units in self.TIMEDELTA_UNITS:
-            if unit in units:
-                parsed = timedelta(**{self.TIMEDELTA_UNITS[units]: int(value)})
-                break
-
-        if parsed is None:
+        timedelta_unit = self._TIMEDELTA_UNIT_ALIASES.get(unit)
+        if timedelta_unit is None:
             raise ValueError(f"Invalid timedelta {raw!r}.")
+        parsed = timedelta(**{timedelta_unit: int(value)})
 
         if self.gt is not None:
             a(parsed > self.gt, parsed, f"is not greater than {self.gt}")
@@ -365,11 +394,16 @@ class List(ClypiParser[list[X]]):
     def __init__(self, inner: Parser[X]) -> None:
         self._inner = inner
 
+        # Plain strings don't need to be parsed at all (e.g.: list[str])
+        self._passthrough = type(inner) is Str and inner.is_passthrough()
+
     @override
     def __call__(self, raw: str | list[str], /) -> list[X]:
         if isinstance(raw, str):
             raw = trim_split_collection(raw)
-        return [self._inner(item) for item in raw]
+        if self._passthrough:
+            return t.cast(list[X], list(raw))
+        return list(map(self._inner, raw))
 
     @override
     def __repr__(self) -> str:
@@ -392,14 +426,13 @@ class Tuple(ClypiParser[tuple[t.Any]]):
                 f"Expected tuple of length {self._num} but instead got {len(raw)} items: {raw!r}"
             )
 
-        # Get all parsers for each item in the tuple (or reuse if tuple[T, ...])
+        # Unbounded tuples (tuple[T, ...]) parse every item with the same parser
         if not self._num:
-            inner_parsers = [self._inner[0]] * len(raw)
-        else:
-            inner_parsers = self._inner
+            parser = self._inner[0]
+            return tuple([parser(raw_item) for raw_item in raw])
 
         # Parse each item with it's corresponding parser
-        return tuple(parser(raw_item) for parser, raw_item in zip(inner_parsers, raw))
+        return tuple([parser(raw_item) for parser, raw_item in zip(self._inner, raw)])
 
     @override
     def __repr__(self) -> str:
@@ -412,40 +445,40 @@ class Union(ClypiParser[t.Union[X, Y]]):
         self._left = left
         self._right = right
 
-    @override
-    def __call__(self, raw: str | list[str], /) -> t.Union[X, Y]:
         # Str classes are catch-alls, so we de-prioritize them in unions
         # so that the other type is parsed first. None types are not greedy
         # so we always move them left
-        first, second = self._left, self._right
+        first, second = left, right
         if isinstance(second, NoneParser):
-            first, second = self._right, self._left
+            first, second = right, left
         if isinstance(first, Str):
-            first, second = self._right, self._left
-
-        first_exc, second_exc = None, None
-
-        # Try parsing as the left side of the union
-        try:
-            return first(raw)
-        except CATCH_ERRORS as e:
-            first_exc = e
-
-        # Try parsing as the right side of the union
-        try:
-            return second(raw)
-        except CATCH_ERRORS as e:
-            second_exc = e
-
-        raise CannotParseAsGroup.get(
-            raw,
-            self,
-            [
-                *flatten_exc(first_exc),
-                *flatten_exc(second_exc),
-            ],
+            first, second = right, left
+
+        # Nested unions (e.g.: int | bool | str) are flattened into the order in
+        # which each of their parsers would be tried so that parsing is a single
+        # loop instead of raising and catching through every level
+        self._try_order: tuple[Parser[t.Any], ...] = (
+            *self._flatten(first),
+            *self._flatten(second),
         )
 
+    @staticmethod
+    def _flatten(parser: Parser[t.Any]) -> tuple[Parser[t.Any], ...]:
+        if isinstance(parser, Union):
+            return parser._try_order
+        return (parser,)
+
+    @override
+    def __call__(self, raw: str | list[str], /) -> t.Union[X, Y]:
+        exceptions: list[Exception] = []
+        for parser in self._try_order:
+            try:
+                return parser(raw)
+            except CATCH_ERRORS as e:
+                exceptions.extend(flatten_exc(e))
+
+        raise CannotParseAsGroup.get(raw, self, exceptions)
+
     def _parts(self):
         """
         Some recursive magic here to "flatten" unions
@@ -473,9 +506,21 @@ class Literal(ClypiParser[t.Any]):
         self._values = values
         self._parsers = [from_type(type(v)) for v in values]
 
+        # Most literals are only strings, which parse to themselves, so those can
+        # be matched with a single lookup. Other values could parse from the same
+        # string (e.g.: `1` and `"1"`) so they always go through their parsers
+        self._str_values = (
+            frozenset(values) if all(type(v) is str for v in values) else None
+        )
+
     # TODO: can we return the right type here?
     @override
     def __call__(self, raw: str | list[str], /) -> t.Any:
+        if self._str_values is not None:
+            if isinstance(raw, str) and raw in self._str_values:
+                return raw
+            raise CannotParseAs(raw, self)
+
         for value, parser in zip(self._values, self._parsers):
             with suppress(*CATCH_ERRORS):
                 if parser(raw) == value:
@@ -506,14 +551,20 @@ class Enum(ClypiParser[type[enum.Enum]]):
     def __init__(self, _type: type[enum.Enum]) -> None:
         self._type = _type
 
+        # Names are matched case-insensitively. If two of them only differ in
+        # case, the first one declared wins
+        self._by_lower: dict[str, enum.Enum] = {}
+        for enum_val in _type:
+            self._by_lower.setdefault(enum_val.name.lower(), enum_val)
+
     @override
     def __call__(self, raw: str | list[str], /) -> t.Any:
         if not isinstance(raw, str):
             raise CannotParseAs(raw, self)
 
-        for enum_val in self._type:
-            if raw.lower() == enum_val.name.lower():
-                return enum_val
+        enum_val = self._by_lower.get(raw.lower())
+        if enum_val is not None:
+            return enum_val
 
         raise ValueError(f"Value {raw} is not a valid choice between {self}")
 
@@ -6,10 +6,12 @@ import clypi
 
 
 def main() -> None:
+    boxes: list[str] = []
     for box in clypi.Boxes:
         color = random.choice(clypi.ALL_COLORS)
         content = f"This is a {box.human_name()!r} {color} box!"
-        print(clypi.boxed(content, style=box, color=color))
+        boxes.append(clypi.boxed(content, style=box, color=color))
+    print("\n".join(boxes))
 
 
 if __name__ == "__main__":
@@ -6,19 +6,29 @@ from pathlib import Path
 from typing_extensions import override
 
 import clypi.parsers as cp
-from clypi import Command, Positional, Spinner, arg, boxed, cprint, style
-
+from clypi import Command, Positional, Spinner, Styler, arg, boxed, cprint
 
 # ---- START DEMO UTILS ----
+_debug_style = Styler(bold=True)
+
+
 def debug(command: Command) -> None:
     """
     Just a utility function to display the commands being passed in a somewhat
     nice way
     """
-    box = boxed(style(command, bold=True), title="Debug", color="magenta")
+    box = boxed(_debug_style(command), title="Debug", color="magenta")
     print(box, end="\n\n")
 
 
+async def run_file(spinner: Spinner, file: str | Path) -> None:
+    """
+    Pretends to run a file, logging it once it's done
+    """
+    await asyncio.sleep(2)
+    spinner.log(f"Done with {file}")
+
+
 # ---- END DEMO UTILS ----
 
 
@@ -41,11 +51,11 @@ class RunParallel(Command):
         debug(self)
         cprint(f"{self.env.name} - Running all files", fg="blue", bold=True)
 
-        async with Spinner(f"Running {', '.join(self.files)} in parallel"):
-            await asyncio.sleep(2)
-
-        async with Spinner(f"Linting {', '.join(self.files)} in parallel"):
-            await asyncio.sleep(2)
+        files = ", ".join(self.files)
+        async with Spinner(f"Running {files} in parallel") as s:
+            await asyncio.gather(*(run_file(s, f) for f in self.files))
+            s.reset(f"Linting {files} in parallel")
+            await asyncio.gather(*(run_file(s, f) for f in self.files))
 
         cprint("\nDone!", fg="green", bold=True)
 
@@ -63,8 +73,8 @@ class RunSerial(Command):
         debug(self)
         cprint(f"{self.env.name} - Running all files", fg="blue", bold=True)
         for f in self.files:
-            async with Spinner(f"Running {f.as_posix()} in parallel"):
-                await asyncio.sleep(2)
+            async with Spinner(f"Running {f.as_posix()}") as s:
+                await run_file(s, f)
         cprint("\nDone!", fg="green", bold=True)
 
 
@@ -1,29 +1,27 @@
 from __future__ import annotations
 
-from typing import Generator
-
 from clypi import ALL_COLORS, ColorType, boxed, stack, style
 
-
 # --- DEMO UTILS ---
-def _all_colors() -> Generator[tuple[ColorType, ...], None, None]:
-    mid = len(ALL_COLORS) // 2
-    normal, bright = ALL_COLORS[:mid], ALL_COLORS[mid:]
-    for color in zip(normal, bright):
-        yield color
+_MID = len(ALL_COLORS) // 2
+
+# Each color paired with its bright version
+_COLOR_PAIRS: tuple[tuple[ColorType, ColorType], ...] = tuple(
+    zip(ALL_COLORS[:_MID], ALL_COLORS[_MID:])
+)
 
 
 # --- DEMO START ---
 def main() -> None:
     fg_block: list[str] = []
-    for color, bright_color in _all_colors():
+    for color, bright_color in _COLOR_PAIRS:
         fg_block.append(
             style("██ " + color.ljust(9), fg=color)
             + style("██ " + bright_color.ljust(16), fg=bright_color)
         )
 
     bg_block: list[str] = []
-    for color, bright_color in _all_colors():
+    for color, bright_color in _COLOR_PAIRS:
         bg_block.append(
             style(color.ljust(9), bg=color)
             + " "
@@ -37,14 +37,17 @@ def main() -> None:
     )
 
     # -----------
-    print()
-    clypi.cprint("🚀 Summary", bold=True, fg="green")
     answer = clypi.Styler(fg="magenta", bold=True)
-    print(" ↳  Name:", answer(name))
-    print(" ↳  Clypi is cool:", answer(is_cool))
-    print(" ↳  Age:", answer(age))
-    print(" ↳  Hours in a day:", answer(hours), f"({type(hours).__name__})")
-    print(" ↳  Earth age:", answer(earth))
+    summary = [
+        "",
+        clypi.style("🚀 Summary", bold=True, fg="green"),
+        f" ↳  Name: {answer(name)}",
+        f" ↳  Clypi is cool: {answer(is_cool)}",
+        f" ↳  Age: {answer(age)}",
+        f" ↳  Hours in a day: {answer(hours)} ({type(hours).__name__})",
+        f" ↳  Earth age: {answer(earth)}",
+    ]
+    print("\n".join(summary))
 
 
 if __name__ == "__main__":
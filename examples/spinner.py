@@ -1,5 +1,6 @@
 import asyncio
 import sys
+import typing as t
 
 from clypi import Spin, Spinner, cprint, spinner
 
@@ -23,16 +24,16 @@ async def subprocess():
     # Example with subprocess
     title = "Example with subprocess"
     async with Spinner(title) as s:
-        # Fist subprocess
-        proc = await asyncio.create_subprocess_shell(
-            "for i in $(seq 1 10); do date && sleep 0.2; done;",
-            stdout=asyncio.subprocess.PIPE,
-        )
-
-        # Second subprocess
-        proc2 = await asyncio.create_subprocess_shell(
-            "for i in $(seq 1 20); do echo $RANDOM && sleep 0.1; done;",
-            stdout=asyncio.subprocess.PIPE,
+        # Both subprocesses are independent so they're started at the same time
+        proc, proc2 = await asyncio.gather(
+            asyncio.create_subprocess_shell(
+                "for i in $(seq 1 10); do date && sleep 0.2; done;",
+                stdout=asyncio.subprocess.PIPE,
+            ),
+            asyncio.create_subprocess_shell(
+                "for i in $(seq 1 20); do echo $RANDOM && sleep 0.1; done;",
+                stdout=asyncio.subprocess.PIPE,
+            ),
         )
 
         coros = (
@@ -73,4 +74,17 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Spinners and subprocess pipes run faster on uvloop if it's installed
+    loop_factory: t.Callable[[], asyncio.AbstractEventLoop] | None = None
+    try:
+        import uvloop  # pyright: ignore[reportMissingImports]
+
+        loop_factory = t.cast(
+            t.Callable[[], asyncio.AbstractEventLoop],
+            uvloop.new_event_loop,  # pyright: ignore[reportUnknownMemberType]
+        )
+    except ImportError:
+        pass
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
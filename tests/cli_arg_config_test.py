@@ -1,8 +1,17 @@
 import typing as t
+from dataclasses import fields
 
 import pytest
 
-from clypi._cli.arg_config import Nargs, _get_nargs  # type: ignore
+from clypi import Positional
+from clypi._cli.arg_config import (
+    _SHARED_FIELDS,  # type: ignore
+    Config,
+    Nargs,
+    PartialConfig,
+    _get_nargs,  # type: ignore
+)
+from clypi.parsers import Int, NoneParser, Parser, from_type
 
 
 @pytest.mark.parametrize(
@@ -19,3 +28,48 @@ from clypi._cli.arg_config import Nargs, _get_nargs  # type: ignore
 )
 def test_get_nargs(_type: t.Any, expected: Nargs):
     assert _get_nargs(_type) == expected
+
+
+@pytest.mark.parametrize(
+    "name,_type,display_name,nargs,modifier",
+    [
+        ("verbose", bool, "--verbose", 0, ""),
+        ("dry_run", bool, "--dry-run", 0, ""),
+        ("files", Positional[list[str]], "files", "*", "…"),
+        ("some_file", Positional[str], "some-file", 1, ""),
+    ],
+)
+def test_config_derived_fields(
+    name: str, _type: t.Any, display_name: str, nargs: Nargs, modifier: str
+):
+    conf = Config(name=name, parser=from_type(_type), arg_type=_type)
+    assert conf.display_name == display_name
+    assert conf.nargs == nargs
+    assert conf.modifier == modifier
+    assert conf.is_positional == (not display_name.startswith("--"))
+
+
+def test_from_partial_does_not_copy_values():
+    default = ["a", "b"]
+    partial: PartialConfig[list[str]] = PartialConfig(default=default, help="Some help")
+    parser: Parser[list[str]] = from_type(list[str])
+    conf = Config[list[str]].from_partial(
+        partial, name="files", parser=parser, arg_type=list[str]
+    )
+    assert conf.default is default
+    assert conf.help == "Some help"
+    assert conf.name == "files"
+
+
+def test_shared_fields_match_config_order():
+    config_fields = [f.name for f in fields(Config) if f.init]
+    assert tuple(config_fields[3:]) == _SHARED_FIELDS
+
+
+def test_help_fields_are_computed_once():
+    parser = Int() | NoneParser()
+    conf = Config(name="count", parser=parser, arg_type=int | None)
+    assert conf.type_display == "(INTEGER|NONE)"
+    assert conf.type_display is conf.type_display
+    assert conf.upper_name == "COUNT"
+    assert conf.upper_name is conf.upper_name
@@ -8,7 +8,7 @@ import pytest
 from typing_extensions import override
 
 from clypi import Command, Positional, arg, configure, get_config
-from clypi._cli.arg_parser import normalize_args
+from clypi._cli.arg_parser import dash_to_snake, normalize_args, parse_as_attr
 
 
 def parametrize(args: str, cases: list[tuple[t.Any, ...]]):
@@ -67,12 +67,65 @@ def join_mult(s: str, n: int):
             ["-a", "-10"],
             ["-a", "-10"],
         ),
+        (
+            ["--foo=a=b", "key=value"],
+            ["--foo", "a=b", "key=value"],
+        ),
+        (
+            ["--foo=", ""],
+            ["--foo", "", ""],
+        ),
+        # Args with a trailing new line aren't flags (e.g.: pasted values)
+        (
+            ["-aZA\n"],
+            ["-aZA\n"],
+        ),
     ],
 )
 def test_normalize_args(args: list[str], expected: list[str]):
     assert normalize_args(args) == expected
 
 
+@pytest.mark.parametrize(
+    "arg,value,arg_type",
+    [
+        ("--flag", "flag", "long-opt"),
+        ("--some-flag_2", "some_flag_2", "long-opt"),
+        ("--f", "--f", "pos"),
+        ("--2flag", "--2flag", "pos"),
+        ("--fl@g", "--fl@g", "pos"),
+        ("-f", "f", "short-opt"),
+        ("-1", "-1", "pos"),
+        ("-", "-", "pos"),
+        ("-ab", "-ab", "pos"),
+        ("foo", "foo", "pos"),
+        ("", "", "pos"),
+        ("-a\n", "-a\n", "pos"),
+        ("--flag\n", "--flag\n", "pos"),
+    ],
+)
+def test_parse_as_attr(arg: str, value: str, arg_type: str):
+    parsed = parse_as_attr(arg)
+    assert parsed.value == value
+    assert parsed.orig == arg
+    assert parsed.arg_type == arg_type
+
+
+@pytest.mark.parametrize(
+    "arg,expected",
+    [
+        ("--some-flag", "some_flag"),
+        ("-f", "f"),
+        ("---many-dashes", "many_dashes"),
+        ("no-dashes", "no_dashes"),
+        ("already_snake", "already_snake"),
+        ("", ""),
+    ],
+)
+def test_dash_to_snake(arg: str, expected: str):
+    assert dash_to_snake(arg) == expected
+
+
 class ExampleSub(Command):
     pos2: Positional[tuple[str, ...]]
     flag2: bool = False
@@ -424,3 +477,58 @@ def test_parse_tuple_list():
         ("b", 2),
         ("c", 3),
     ]
+
+
+def test_parse_validates_fields_once(monkeypatch: pytest.MonkeyPatch):
+    calls: list[dict[str, t.Any]] = []
+    validate = Example._validate_fields  # type: ignore
+
+    def _validate_fields(fields: dict[str, t.Any], name: str) -> dict[str, t.Any]:
+        calls.append(fields)
+        return validate(fields, name)
+
+    monkeypatch.setattr(Example, "_validate_fields", _validate_fields)
+
+    ec = Example.parse(["--flag", "./some-path"])
+    assert ec.flag is True
+    assert ec.pos == Path("./some-path")
+    assert len(calls) == 1
+
+
+def test_parse_runs_overridden_init():
+    class Custom(Command):
+        flag: bool = False
+
+        def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+            super().__init__(*args, **kwargs)
+            self.initialized = True
+
+    cmd = Custom.parse(["--flag"])
+    assert cmd.flag is True
+    assert cmd.initialized is True
+
+
+@pytest.mark.parametrize("help_arg", ["-h", "--help", "help", "HELP", "--Help"])
+def test_parse_help_args(help_arg: str, capsys: pytest.CaptureFixture[str]):
+    with pytest.raises(SystemExit) as exc_info:
+        Example.parse(["--flag", help_arg])
+
+    assert exc_info.value.code == 0
+    assert "Usage:" in capsys.readouterr().out
+
+
+def test_parsers_receive_scalars_for_single_values():
+    received: list[t.Any] = []
+
+    def _record(raw: str | list[str]) -> t.Any:
+        received.append(raw)
+        return raw
+
+    class Cmd(Command):
+        single: str = arg(parser=_record)
+        multiple: list[str] = arg(parser=_record)
+
+    cmd = Cmd.parse(["--single", "a", "--multiple", "b", "c"])
+    assert cmd.single == "a"
+    assert cmd.multiple == ["b", "c"]
+    assert received == ["a", ["b", "c"]]
@@ -6,6 +6,7 @@ from typing_extensions import override
 
 from clypi import Command, Positional, arg
 from clypi._cli.arg_parser import Arg
+from clypi._cli.main import _camel_to_dashed  # type: ignore
 
 
 def _raise_error() -> str:
@@ -219,3 +220,30 @@ def test_repeated_subcommands():
             subcommand: Example1 | Example2
 
     assert exc_info.value.args[0] == "Found duplicate subcommand 'example' in Main"
+
+
+@pytest.mark.parametrize(
+    "name,expected",
+    [
+        ("Run", "run"),
+        ("RunSerial", "run-serial"),
+        ("HTTPServer", "h-t-t-p-server"),
+        ("already_lower", "already_lower"),
+        ("", ""),
+    ],
+)
+def test_camel_to_dashed(name: str, expected: str):
+    assert _camel_to_dashed(name) == expected
+
+
+def test_help_is_cached_per_class():
+    class Parent(Command):
+        """Parent docs"""
+
+    class Child(Parent):
+        """Child docs"""
+
+    assert Parent.help() == "Parent docs"
+    assert Child.help() == "Child docs"
+    assert Parent.prog() == "parent"
+    assert Child.prog() == "child"
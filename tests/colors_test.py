@@ -0,0 +1,17 @@
+import pytest
+
+from clypi import style
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected",
+    [
+        ({"fg": "red"}, "\x1b[31mfoo\x1b[39m"),
+        ({"fg": "bright_red"}, "\x1b[91mfoo\x1b[39m"),
+        ({"bg": "green"}, "\x1b[42mfoo\x1b[49m"),
+        ({"bg": "bright_default"}, "\x1b[109mfoo\x1b[49m"),
+        ({"fg": "blue", "bold": True}, "\x1b[1m\x1b[34mfoo\x1b[39m\x1b[0m"),
+    ],
+)
+def test_style(kwargs: dict[str, str], expected: str):
+    assert style("foo", **kwargs) == expected  # type: ignore
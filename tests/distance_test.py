@@ -33,3 +33,22 @@ def test_distance(this: str, other: str, expected: str):
 )
 def test_closest(this: str, others: list[str], expected: tuple[str, int]):
     assert closest(this, others) == expected
+
+
+@pytest.mark.parametrize(
+    "this,others,max_dist,expected",
+    [
+        ("that", ["this", "foo"], 2, ("this", 2)),
+        ("that", ["this", "foo"], 1, ("", float("inf"))),
+        ("a", ["version", "b", "c"], 2, ("b", 1)),
+        ("flag", ["something-long", "flags"], 2, ("flags", 1)),
+    ],
+)
+def test_closest_max_dist(
+    this: str, others: list[str], max_dist: float, expected: tuple[str, float]
+):
+    assert closest(this, others, max_dist=max_dist) == expected
+
+
+def test_closest_iterable():
+    assert closest("that", (o for o in ["foo", "this"])) == ("this", 2)
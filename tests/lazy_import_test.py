@@ -0,0 +1,56 @@
+import subprocess
+import sys
+
+import clypi
+
+
+def _imported_after(code: str) -> set[str]:
+    script = f"import sys; {code}; print(' '.join(sys.modules))"
+    out = subprocess.check_output([sys.executable, "-c", script], text=True)
+    return {m for m in out.split() if m.startswith("clypi")}
+
+
+def test_import_is_lazy():
+    assert _imported_after("import clypi") == {"clypi"}
+
+
+def test_access_imports_module():
+    modules = _imported_after("import clypi; clypi.style")
+    assert "clypi._colors" in modules
+    assert "clypi._cli.main" not in modules
+
+
+def test_all_names_resolve():
+    for name in clypi.__all__:
+        assert getattr(clypi, name) is not None
+    assert set(clypi.__all__) <= set(dir(clypi))
+    assert "__name__" in dir(clypi)
+
+
+def test_formatter_does_not_import_prompts():
+    modules = _imported_after("import clypi; clypi.ClypiFormatter")
+    assert "clypi._prompts" not in modules
+    assert "clypi._components.spinners" not in modules
+
+
+def test_command_does_not_import_spinners():
+    modules = _imported_after("import clypi; clypi.Command")
+    assert "clypi._components.spinners" not in modules
+
+
+def test_parsers_submodule_is_lazy():
+    assert "clypi.parsers" not in _imported_after("import clypi; clypi.style")
+    modules = _imported_after("import clypi; clypi.parsers")
+    assert "clypi.parsers" in modules
+
+
+def test_command_does_not_import_asyncio():
+    script = "import sys, clypi; clypi.Command; print('asyncio' in sys.modules)"
+    out = subprocess.check_output([sys.executable, "-c", script], text=True)
+    assert out.strip() == "False"
+
+
+def test_parsers_does_not_import_dateutil():
+    script = "import sys, clypi; clypi.parsers; print('dateutil' in sys.modules)"
+    out = subprocess.check_output([sys.executable, "-c", script], text=True)
+    assert out.strip() == "False"
@@ -6,7 +6,7 @@ from pathlib import Path
 import pytest
 
 import clypi.parsers as cp
-from clypi import Positional
+from clypi import Command, Positional
 
 
 class Color(enum.Enum):
@@ -36,6 +36,7 @@ SUCCESS_PRIMITIVES = [
     ("1d", cp.TimeDelta(), timedelta(days=1)),
     ("1 day", cp.TimeDelta(), timedelta(days=1)),
     ("2weeks", cp.TimeDelta(), timedelta(weeks=2)),
+    ("1d\n", cp.TimeDelta(), timedelta(days=1)),
     ("./tests/parsers_test.py", cp.Path(), Path("./tests/parsers_test.py")),
     (
         "./tests/parsers_test.py",
@@ -51,8 +52,10 @@ SUCCESS_PRIMITIVES = [
     ("1", cp.Union(cp.Int(), cp.Bool()), 1),
     ("1", cp.Literal(1, "foo"), 1),
     ("foo", cp.Literal(1, "foo"), "foo"),
+    ("b", cp.Literal("a", "b", "c"), "b"),
     ("red", cp.Enum(Color), Color.RED),
     ("blue", cp.Enum(Color), Color.BLUE),
+    ("BLUE", cp.Enum(Color), Color.BLUE),
     ("none", cp.NoneParser(), None),
     ("", cp.NoneParser(), None),
     ("", cp.Str() | cp.NoneParser(), None),
@@ -72,6 +75,7 @@ FAILURE_PRIMITIVES = [
     ("lsf2", cp.DateTime()),
     ("1 month", cp.TimeDelta()),
     ("1y", cp.TimeDelta()),
+    (" 1d", cp.TimeDelta()),
     (
         "./tests/parsers_test2.py",
         cp.Path(exists=True),
@@ -177,6 +181,28 @@ def test_parser_from_type(_type: t.Any, expected: cp.Parser[t.Any]):
     assert cp.from_type(_type) == expected
 
 
+def test_parser_from_type_returns_new_instances():
+    assert cp.from_type(list[int]) is not cp.from_type(list[int])
+    assert cp.from_type(int) is not cp.from_type(int)
+
+
+def test_command_parsers_are_cached():
+    class Main(Command):
+        a: list[int]
+        b: list[int]
+        c: Positional[int]
+        d: bool | int = 1
+        e: int | bool = 1
+
+    opts = Main.options()
+    assert opts["a"].parser is opts["b"].parser
+    assert opts["a"].parser is not cp.from_type(list[int])
+
+    # Equal unions with a different order keep their own order
+    assert str(opts["d"].parser) == "(yes|no|integer)"
+    assert str(opts["e"].parser) == "(integer|yes|no)"
+
+
 @pytest.mark.parametrize(
     "parser,expected",
     [
@@ -224,3 +250,37 @@ def test_parse_tuple_list():
 )
 def test_date_with_tz(parser: cp.DateTime, input: str, expected: datetime):
     assert parser(input) == expected
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("", None),
+        ("none", None),
+        ("1", 1),
+        ("foo", "foo"),
+    ],
+)
+def test_nested_union_order(value: str, expected: t.Any):
+    parser = cp.Str() | cp.Int() | cp.NoneParser()
+    assert parser(value) == expected
+
+
+def test_nested_union_errors():
+    parser = cp.Int() | cp.Bool() | cp.Float()
+    with pytest.raises(cp.CannotParseAsGroup) as exc_info:
+        parser("foo")
+
+    assert exc_info.value.message == "Cannot parse 'foo' as (integer|yes|no|float)"
+    assert len(exc_info.value.exceptions) == 3
+
+
+def test_str_list_parser():
+    raw = ["a", "b"]
+    parsed = cp.List(cp.Str())(raw)
+    assert parsed == ["a", "b"]
+    assert parsed is not raw
+
+    assert cp.List(cp.Str())("a, b") == ["a", "b"]
+    with pytest.raises(ValueError):
+        cp.List(cp.Str(min=2))(["ab", "c"])
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from clypi._colors import remove_style
+from clypi._components import spinners
+from clypi._components.spinners import Spinner, _PerLineIO  # type: ignore
+
+
+@pytest.mark.parametrize(
+    "writes,expected",
+    [
+        (["foo\n"], ["foo"]),
+        (["foo", "\n"], ["foo"]),
+        (["fo", "o\nba", "r\n"], ["foo", "bar"]),
+        (["foo\n\nbar\n"], ["foo", "", "bar"]),
+        (["foo"], []),
+        (["f", "o", "o", "", "\nbar"], ["foo"]),
+        (["foo\r\nbar\r", "\n"], ["foo", "bar"]),
+        (["col1\x0ccol2\n"], ["col1\x0ccol2"]),
+        (["foo\rbar\n"], ["foo\rbar"]),
+        (["foo\r\r\n"], ["foo\r"]),
+    ],
+)
+def test_per_line_io(writes: list[str], expected: list[str]):
+    lines: list[str] = []
+    io = _PerLineIO(lines.append)
+    for s in writes:
+        io.write(s)
+    assert lines == expected
+
+
+def test_per_line_io_flush():
+    lines: list[str] = []
+    io = _PerLineIO(lines.append)
+    io.write("foo\nbar")
+    io.flush()
+    assert lines == ["foo", "bar"]
+
+    # Nothing pending, so nothing to print
+    io.flush()
+    assert lines == ["foo", "bar"]
+
+    # Closed buffers drop whatever they had pending
+    io.write("baz")
+    io.close()
+    io.flush()
+    assert lines == ["foo", "bar"]
+
+
+@pytest.mark.parametrize("chunk_size", [2**16, 2])
+def test_spinner_pipe(
+    chunk_size: int,
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(spinners, "_PIPE_CHUNK_SIZE", chunk_size)
+
+    async def _main():
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"foo\nba")
+        reader.feed_data(b"r\n\nbaz")
+        reader.feed_eof()
+        async with Spinner("test", output="stdout") as s:
+            await s.pipe(reader, prefix="(p)")
+
+    asyncio.run(_main())
+    out = remove_style(capsys.readouterr().out)
+    assert [line.split("┃ ")[-1] for line in out.split("\n") if "┃" in line] == [
+        "(p) foo",
+        "(p) bar",
+        "(p)",
+        "(p) baz",
+    ]
+
+
+def test_spinner_reset(capsys: pytest.CaptureFixture[str]):
+    async def _main():
+        async with Spinner("first", output="stdout") as s:
+            s.reset("second")
+            s.reset("third", msg="second!")
+
+    asyncio.run(_main())
+    out = remove_style(capsys.readouterr().out)
+    done = [line.split("✔ ")[-1] for line in out.split("\n") if "✔" in line]
+    assert done == ["first", "second!", "third"]
@@ -4,6 +4,7 @@ from types import NoneType
 import pytest
 
 from clypi._type_util import (
+    cache_by_type,
     is_list,
     is_literal,
     is_optional,
@@ -11,6 +12,7 @@ from clypi._type_util import (
     is_union,
     literal_inner,
     tuple_inner,
+    tuple_size,
     union_inner,
 )
 
@@ -85,6 +87,19 @@ def test_tuple_inner(_type: t.Any, inner_t: t.Any, num: int):
     assert tuple_inner(_type) == (inner_t, num)
 
 
+@pytest.mark.parametrize(
+    "_type,num",
+    [
+        (tuple[str], 1),
+        (tuple[str, int], 2),
+        (tuple[str, ...], None),
+        (t.Annotated[tuple[str, ...], 1], None),
+    ],
+)
+def test_tuple_size(_type: t.Any, num: int | None):
+    assert tuple_size(_type) == num
+
+
 @pytest.mark.parametrize(
     "_type,inner_t",
     [
@@ -106,3 +121,20 @@ def test_union_inner(_type: t.Any, inner_t: t.Any):
 )
 def test_literal_inner(_type: t.Any, inner: t.Any):
     assert literal_inner(_type) == inner
+
+
+def test_cache_by_type():
+    calls: list[t.Any] = []
+
+    @cache_by_type
+    def fun(_type: t.Any) -> str:
+        calls.append(_type)
+        return str(_type)
+
+    assert fun(list[str]) == fun(list[str]) == "list[str]"
+    assert calls == [list[str]]
+
+    # Unhashable metadata is not cached but still computed
+    unhashable = t.Annotated[int, {"a": 1}]
+    assert fun(unhashable) == fun(unhashable)
+    assert calls == [list[str], unhashable, unhashable]